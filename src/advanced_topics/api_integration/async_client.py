@@ -0,0 +1,153 @@
+# Concurrent Gemini requests
+# Wraps one genai.GenerativeModel (so its underlying connection is reused)
+# and sends many prompts at once: a semaphore caps how many are in flight, a
+# token bucket caps requests per second, and transient failures are retried
+# with jittered exponential backoff. Results come back in prompt order.
+#
+# The model is passed in, so any object with generate_content() (or
+# generate_content_async()) works, including a fake one in tests.
+
+import asyncio
+import random
+import time
+
+from response_cache import CachedResponse, model_name_of
+
+# Exception class names from google.api_core that are worth retrying.
+TRANSIENT_ERRORS = {
+    "ResourceExhausted",
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+    "InternalServerError",
+    "TooManyRequests",
+    "GatewayTimeout",
+}
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def is_transient(error):
+    """True for rate-limit, timeout and server-side errors."""
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    if type(error).__name__ in TRANSIENT_ERRORS:
+        return True
+    return getattr(error, "code", None) in TRANSIENT_STATUS_CODES
+
+
+class TokenBucket:
+    """Allows `rate` requests per second with bursts of up to `capacity`."""
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = None
+
+    async def acquire(self):
+        # Created lazily so the bucket can be built outside a running loop.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncGeminiClient:
+    """Send prompts to a model concurrently, with limits and retries.
+
+    client = AsyncGeminiClient(genai.GenerativeModel("gemini-2.0-flash-exp"),
+                               max_concurrency=8, requests_per_second=5)
+    responses = client.run_many(["What is Python?", "What is a tuple?"])
+
+    With a ResponseCache, cached prompts are answered without a request.
+
+    Backoff before retry n (from 0) is a random delay between 0 and
+    min(max_delay, base_delay * 2 ** n), so clients that failed together
+    don't retry together.
+    """
+
+    def __init__(self, model, max_concurrency=8, requests_per_second=None, burst=None,
+                 max_retries=4, base_delay=0.5, max_delay=20.0, retry_on=is_transient,
+                 cache=None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.cache = cache
+        self.bucket = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        self.stats = {"requests": 0, "retries": 0, "failures": 0}
+        self._semaphore = None
+
+    def _backoff(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def _call(self, prompt, kwargs):
+        generate_async = getattr(self.model, "generate_content_async", None)
+        if generate_async is not None:
+            return await generate_async(prompt, **kwargs)
+        # The blocking SDK call runs in the default thread pool.
+        return await asyncio.to_thread(self.model.generate_content, prompt, **kwargs)
+
+    async def generate(self, prompt, **kwargs):
+        """Return the model's response to one prompt, retrying transient errors."""
+        if self.cache is not None:
+            # SQLite lookups are well under a millisecond, so they run inline.
+            name = model_name_of(self.model)
+            text = self.cache.get(name, prompt, kwargs or None)
+            if text is not None:
+                return CachedResponse(text)
+            response = await self._generate(prompt, kwargs)
+            self.cache.put(name, prompt, response.text, kwargs or None)
+            return response
+        return await self._generate(prompt, kwargs)
+
+    async def _generate(self, prompt, kwargs):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                if self.bucket is not None:
+                    await self.bucket.acquire()
+                self.stats["requests"] += 1
+                try:
+                    return await self._call(prompt, kwargs)
+                except Exception as error:
+                    if attempt >= self.max_retries or not self.retry_on(error):
+                        self.stats["failures"] += 1
+                        raise
+            # Back off without holding a concurrency slot.
+            self.stats["retries"] += 1
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    async def generate_many(self, prompts, return_exceptions=False, **kwargs):
+        """Return responses in the same order as prompts.
+
+        With return_exceptions=True a failed prompt's exception takes its
+        place in the list instead of cancelling the rest.
+        """
+        return await asyncio.gather(
+            *(self.generate(prompt, **kwargs) for prompt in prompts),
+            return_exceptions=return_exceptions,
+        )
+
+    def run_many(self, prompts, return_exceptions=False, **kwargs):
+        """Blocking version of generate_many() for scripts."""
+        self._semaphore = None
+        if self.bucket is not None:
+            self.bucket._lock = None
+        return asyncio.run(self.generate_many(prompts, return_exceptions, **kwargs))
@@ -0,0 +1,63 @@
+# Benchmark: cold-start import cost of the Gemini integration
+# Runs `python -X importtime -c "<statement>"` in fresh interpreters and
+# reports the cumulative import time of the modules each one loads.
+# Usage: python bench_startup.py [runs]
+
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+CASES = [
+    # What the old gemini_api.py did at import time.
+    ("eager SDK import", "import dotenv, google.generativeai"),
+    ("gemini_client", "import gemini_client"),
+    ("gemini_api", "import gemini_api"),
+]
+
+
+def top_level_imports(statement):
+    """Return {module: cumulative microseconds} for the modules statement
+    imports directly, or None if it fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=HERE, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return None
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"; nested
+        # imports are indented under the module that triggered them.
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def import_time(statement, startup):
+    """Microseconds spent importing what statement adds beyond startup."""
+    times = top_level_imports(statement)
+    if times is None:
+        return None
+    return sum(cumulative for name, cumulative in times.items() if name not in startup)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    startup = top_level_imports("pass")
+    print(f"Best of {runs} cold starts, import time beyond interpreter startup:")
+    for label, statement in CASES:
+        times = [import_time(statement, startup) for _ in range(runs)]
+        if None in times:
+            print(f"{label:<18} not importable here (missing dependency)")
+            continue
+        print(f"{label:<18} {min(times) / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
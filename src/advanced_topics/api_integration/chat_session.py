@@ -0,0 +1,232 @@
+# Chat sessions with a bounded history
+# model.start_chat() resends every earlier message with each new one, so
+# requests grow with the conversation. ChatSession keeps only the recent
+# turns that fit in a token budget; older turns are handed to a policy that
+# either drops them or folds them into a short summary sent in their place.
+# ChatManager serves many sessions from one process, keeping the recently
+# used ones in memory and the rest as small JSON files.
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT = (
+    "Summarise this conversation between a student and a Python tutor in at "
+    "most {words} words, keeping names, facts and open questions:\n\n{text}"
+)
+
+
+def estimate_tokens(text):
+    """Rough token count (about 4 characters per token), with no API call."""
+    return len(text) // 4 + 1
+
+
+def drop_oldest(summary, dropped):
+    """Policy: forget old turns entirely."""
+    return summary
+
+
+def summarize_with(model, words=80):
+    """Policy: ask `model` to merge old turns into the running summary."""
+    def summarize(summary, dropped):
+        lines = [f"Earlier summary: {summary}"] if summary else []
+        lines.extend(f"{role}: {text}" for role, text in dropped)
+        prompt = SUMMARY_PROMPT.format(words=words, text="\n".join(lines))
+        return model.generate_content(prompt).text.strip()
+    return summarize
+
+
+class ChatSession:
+    """A conversation that sends at most about max_tokens of history.
+
+    Turns are dropped oldest first, a user message together with the reply
+    to it, and passed to policy(summary, dropped_turns), which returns the
+    new summary (or None). The newest exchange is always kept. If the
+    policy fails, the turns are kept and compaction is retried after the
+    next message. send_message() is serialised by a per-session lock.
+    """
+
+    def __init__(self, model, max_tokens=2000, policy=drop_oldest,
+                 count_tokens=estimate_tokens, session_id=None):
+        self.model = model
+        self.max_tokens = max_tokens
+        self.policy = policy
+        self.count_tokens = count_tokens
+        self.session_id = session_id
+        self.history = []  # [(role, text, tokens)]
+        self.summary = None
+        self._tokens = 0
+        self.lock = threading.RLock()
+
+    def _append(self, role, text):
+        tokens = self.count_tokens(text)
+        self.history.append((role, text, tokens))
+        self._tokens += tokens
+
+    @property
+    def tokens(self):
+        """Estimated tokens of history (and summary) sent with the next message."""
+        summary = self.count_tokens(self.summary) if self.summary else 0
+        return self._tokens + summary
+
+    def contents(self, message=None):
+        """The request contents: summary, kept turns and the new message."""
+        contents = []
+        if self.summary:
+            contents.append({"role": "user", "parts": [f"Summary of our conversation so far: {self.summary}"]})
+            contents.append({"role": "model", "parts": ["Understood."]})
+        contents.extend({"role": role, "parts": [text]} for role, text, _ in self.history)
+        if message is not None:
+            contents.append({"role": "user", "parts": [message]})
+        return contents
+
+    def send_message(self, message, **kwargs):
+        """Send message with the bounded history and return the response."""
+        with self.lock:
+            response = self.model.generate_content(self.contents(message), **kwargs)
+            self._append("user", message)
+            self._append("model", response.text)
+            self.compact()
+            return response
+
+    def compact(self):
+        """Drop (or summarise) the oldest exchanges until within max_tokens.
+
+        The history is only trimmed once the policy has returned, so a failed
+        summary request loses nothing.
+        """
+        with self.lock:
+            keep = len(self.history)
+            tokens = self.tokens
+            while tokens > self.max_tokens and keep > 2:
+                start = len(self.history) - keep
+                tokens -= self.history[start][2] + self.history[start + 1][2]
+                keep -= 2
+            if keep == len(self.history):
+                return
+            cut = len(self.history) - keep
+            dropped = [(role, text) for role, text, _ in self.history[:cut]]
+            try:
+                summary = self.policy(self.summary, dropped)
+            except Exception:
+                logger.warning("Could not compact chat %s; keeping full history", self.session_id, exc_info=True)
+                return
+            self._tokens -= sum(turn[2] for turn in self.history[:cut])
+            del self.history[:cut]
+            self.summary = summary
+
+    def to_dict(self):
+        return {
+            "session_id": self.session_id,
+            "summary": self.summary,
+            "history": [[role, text] for role, text, _ in self.history],
+        }
+
+    @classmethod
+    def from_dict(cls, data, model, **options):
+        session = cls(model, session_id=data.get("session_id"), **options)
+        session.summary = data.get("summary")
+        for role, text in data.get("history", []):
+            session._append(role, text)
+        return session
+
+
+class ChatManager:
+    """Hands out ChatSessions by id, with at most max_sessions in memory.
+
+    When more sessions are active, the least recently used idle one is
+    saved to store_dir (if given) and dropped from memory; get() loads it
+    back. Sessions with a send_message() in flight are never evicted, so use
+    manager.send_message() rather than holding on to get()'s result.
+    options are passed on to every ChatSession.
+    """
+
+    def __init__(self, model, store_dir=None, max_sessions=100, **options):
+        self.model = model
+        self.store_dir = store_dir
+        self.max_sessions = max_sessions
+        self.options = options
+        self._sessions = OrderedDict()
+        self._in_flight = {}  # session_id -> sends currently running
+        self._lock = threading.Lock()
+        if store_dir:
+            os.makedirs(store_dir, exist_ok=True)
+
+    def _path(self, session_id):
+        if os.path.basename(str(session_id)) != str(session_id):
+            raise ValueError(f"Invalid session id {session_id!r}")
+        return os.path.join(self.store_dir, f"{session_id}.json")
+
+    def get(self, session_id):
+        with self._lock:
+            session = self._get(session_id)
+            self._evict()
+            return session
+
+    def _get(self, session_id):
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+            return session
+        session = self._load(session_id)
+        if session is None:
+            session = ChatSession(self.model, session_id=session_id, **self.options)
+        self._sessions[session_id] = session
+        return session
+
+    def _evict(self):
+        """Save and drop the least recently used idle sessions over the limit."""
+        excess = len(self._sessions) - self.max_sessions
+        if excess <= 0:
+            return
+        idle = [key for key in self._sessions if key not in self._in_flight][:excess]
+        for key in idle:
+            session = self._sessions.pop(key)
+            with session.lock:
+                self._save(session)
+
+    def send_message(self, session_id, message, **kwargs):
+        with self._lock:
+            session = self._get(session_id)
+            self._in_flight[session_id] = self._in_flight.get(session_id, 0) + 1
+        try:
+            return session.send_message(message, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight[session_id] -= 1
+                if not self._in_flight[session_id]:
+                    del self._in_flight[session_id]
+                self._evict()
+
+    def _load(self, session_id):
+        if not self.store_dir:
+            return None
+        try:
+            with open(self._path(session_id), encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+        return ChatSession.from_dict(data, self.model, **self.options)
+
+    def _save(self, session):
+        if not self.store_dir:
+            return
+        path = self._path(session.session_id)
+        temporary = path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(session.to_dict(), file, ensure_ascii=False)
+        # Replace in one step so a crash never leaves half a file.
+        os.replace(temporary, path)
+
+    def save_all(self):
+        with self._lock:
+            for session in self._sessions.values():
+                with session.lock:
+                    self._save(session)
+
+    def __len__(self):
+        return len(self._sessions)
@@ -1,65 +1,97 @@
-import os
-from dotenv import load_dotenv
-import google.generativeai as genai
+import sys
 
-load_dotenv()
+from gemini_client import MissingAPIKeyError, get_model
 
-api_key = os.getenv("GEMINI_API_KEY")
-
-if not api_key:
-    print("Error: GEMINI_API_KEY not found in environment variables")
-    print("Please create a .env file with: GEMINI_API_KEY=your_api_key_here")
-    exit(1)
-
-genai.configure(api_key=api_key)
-
-print("=== Gemini Flash 2.0 API Integration ===\n")
-
-model = genai.GenerativeModel("gemini-2.0-flash-exp")
-
-print("Example 1: Simple Question")
-response = model.generate_content("What is Python programming language?")
-print(f"Response: {response.text}\n")
-
-print("=" * 50)
-print("\nExample 2: Code Explanation")
-code_prompt = """
+CODE_PROMPT = """
 Explain this Python code in simple terms:
 def fibonacci(n):
     if n <= 1:
         return n
     return fibonacci(n-1) + fibonacci(n-2)
 """
-response = model.generate_content(code_prompt)
-print(f"Response: {response.text}\n")
-
-print("=" * 50)
-print("\nExample 3: Student Query")
-student_query = "What are the key differences between lists and tuples in Python?"
-response = model.generate_content(student_query)
-print(f"Question: {student_query}")
-print(f"Response: {response.text}\n")
-
-print("=" * 50)
-print("\nExample 4: Code Generation")
-code_request = "Write a Python function to calculate factorial of a number"
-response = model.generate_content(code_request)
-print(f"Request: {code_request}")
-print(f"Response:\n{response.text}\n")
-
-print("=" * 50)
-print("\nExample 5: Chat Conversation")
-
-chat = model.start_chat(history=[])
-
-message1 = "Hi! I'm learning Python. Can you help me?"
-response1 = chat.send_message(message1)
-print(f"Student: {message1}")
-print(f"Gemini: {response1.text}\n")
-
-message2 = "What is a decorator in Python?"
-response2 = chat.send_message(message2)
-print(f"Student: {message2}")
-print(f"Gemini: {response2.text}\n")
-
-print("API integration examples completed!")
+
+
+def main():
+    # The helpers are imported here so that importing this module stays cheap.
+    from async_client import AsyncGeminiClient
+    from chat_session import ChatSession, summarize_with
+    from response_cache import ResponseCache
+    from streaming import TextStream
+
+    try:
+        model = get_model()
+    except MissingAPIKeyError:
+        print("Error: GEMINI_API_KEY not found in environment variables")
+        print("Please create a .env file with: GEMINI_API_KEY=your_api_key_here")
+        return 1
+
+    print("=== Gemini Flash 2.0 API Integration ===\n")
+
+    # Answers are kept for a week, so re-running the examples uses no quota.
+    cache = ResponseCache(ttl=7 * 24 * 3600)
+
+    print("Example 1: Simple Question")
+    response = cache.generate(model, "What is Python programming language?")
+    print(f"Response: {response.text}\n")
+
+    print("=" * 50)
+    print("\nExample 2: Code Explanation")
+    response = cache.generate(model, CODE_PROMPT)
+    print(f"Response: {response.text}\n")
+
+    print("=" * 50)
+    print("\nExample 3: Student Query")
+    student_query = "What are the key differences between lists and tuples in Python?"
+    response = cache.generate(model, student_query)
+    print(f"Question: {student_query}")
+    print(f"Response: {response.text}\n")
+
+    print("=" * 50)
+    print("\nExample 4: Code Generation")
+    code_request = "Write a Python function to calculate factorial of a number"
+    print(f"Request: {code_request}")
+    print("Response:")
+    # Streamed, so the answer starts printing before the whole of it is ready.
+    stream = TextStream(model, code_request)
+    for text in stream:
+        print(text, end="", flush=True)
+    stats = stream.stats()
+    print(f"\n(first chunk after {stats.first_chunk_seconds:.2f}s, done in {stats.total_seconds:.2f}s)\n")
+
+    print("=" * 50)
+    print("\nExample 5: Chat Conversation")
+
+    # Only about the last 2000 tokens of the conversation are sent each time.
+    chat = ChatSession(model, max_tokens=2000, policy=summarize_with(model))
+
+    message1 = "Hi! I'm learning Python. Can you help me?"
+    response1 = chat.send_message(message1)
+    print(f"Student: {message1}")
+    print(f"Gemini: {response1.text}\n")
+
+    message2 = "What is a decorator in Python?"
+    response2 = chat.send_message(message2)
+    print(f"Student: {message2}")
+    print(f"Gemini: {response2.text}\n")
+
+    print("=" * 50)
+    print("\nExample 6: Many Questions at Once")
+
+    questions = [
+        "What is a list comprehension?",
+        "What is the difference between == and is?",
+        "What does the with statement do?",
+    ]
+    client = AsyncGeminiClient(model, max_concurrency=3, requests_per_second=2, cache=cache)
+    for question, response in zip(questions, client.run_many(questions)):
+        print(f"Question: {question}")
+        print(f"Response: {response.text}\n")
+
+    cache.close()
+    print("API integration examples completed!")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# Gemini client with lazy setup
+# Importing this module is cheap: google.generativeai (which pulls in grpc,
+# protobuf and friends) is only imported, and the .env file only read, the
+# first time a model is actually needed. Both results are cached, so later
+# calls cost nothing. A missing API key raises MissingAPIKeyError at that
+# point instead of exiting the interpreter.
+
+import functools
+import os
+
+DEFAULT_MODEL = "gemini-2.0-flash-exp"
+API_KEY_VARIABLE = "GEMINI_API_KEY"
+
+
+class MissingAPIKeyError(RuntimeError):
+    """Raised when GEMINI_API_KEY is not set in the environment or .env."""
+
+    def __init__(self):
+        super().__init__(
+            f"{API_KEY_VARIABLE} not found in environment variables. "
+            f"Please create a .env file with: {API_KEY_VARIABLE}=your_api_key_here"
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env():
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False
+    return load_dotenv()
+
+
+def get_api_key():
+    """Return the API key from the environment, reading .env the first time."""
+    _load_env()
+    api_key = os.getenv(API_KEY_VARIABLE)
+    if not api_key:
+        raise MissingAPIKeyError()
+    return api_key
+
+
+@functools.lru_cache(maxsize=None)
+def genai():
+    """Import and configure google.generativeai on first use."""
+    api_key = get_api_key()
+    import google.generativeai as sdk
+
+    sdk.configure(api_key=api_key)
+    return sdk
+
+
+@functools.lru_cache(maxsize=None)
+def get_model(name=DEFAULT_MODEL):
+    """Return a shared GenerativeModel for `name`, creating it once."""
+    return genai().GenerativeModel(name)
+
+
+def reset():
+    """Forget cached configuration, e.g. after changing GEMINI_API_KEY."""
+    _load_env.cache_clear()
+    genai.cache_clear()
+    get_model.cache_clear()
@@ -0,0 +1,187 @@
+# On-disk cache for model responses
+# Responses are stored in SQLite under a hash of (model name, prompt,
+# generation config), so asking the same question again costs no API quota.
+# A small in-memory LRU sits in front of the database for repeated lookups
+# within one run; entries expire after `ttl` seconds and the oldest are
+# evicted once the database holds more than max_entries or max_bytes.
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["memory_hits", "disk_hits", "misses", "evictions", "memory_size", "disk_size", "disk_bytes"],
+)
+CachedResponse = namedtuple("CachedResponse", ["text"])
+
+DEFAULT_PATH = "gemini_cache.sqlite3"
+
+
+def cache_key(model_name, prompt, config=None):
+    """Hex digest identifying a request; dict order in config doesn't matter."""
+    payload = json.dumps([model_name, prompt, config], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def model_name_of(model):
+    return getattr(model, "model_name", None) or type(model).__name__
+
+
+class ResponseCache:
+    """Persistent prompt -> response text cache with an LRU memory front.
+
+    with ResponseCache("gemini_cache.sqlite3", ttl=7 * 24 * 3600) as cache:
+        response = cache.generate(model, "What is Python?")
+
+    Hits served from memory don't update the database, so disk eviction
+    order is by last disk access rather than exact LRU.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, memory_size=256, ttl=None,
+                 max_entries=10_000, max_bytes=None):
+        self.path = path
+        self.memory_size = memory_size
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()  # key -> (text, created)
+        self._lock = threading.Lock()
+        self._memory_hits = self._disk_hits = self._misses = self._evictions = 0
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, text TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._entries, self._bytes = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+    def _expired(self, created, now):
+        return self.ttl is not None and now - created > self.ttl
+
+    def _remember(self, key, text, created):
+        memory = self._memory
+        memory[key] = (text, created)
+        memory.move_to_end(key)
+        if len(memory) > self.memory_size:
+            memory.popitem(last=False)
+
+    def get(self, model_name, prompt, config=None):
+        """Return the cached text, or None."""
+        key = cache_key(model_name, prompt, config)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[1], now):
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return entry[0]
+            row = self._db.execute(
+                "SELECT text, created, size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._memory.pop(key, None)
+                self._misses += 1
+                return None
+            text, created, size = row
+            if self._expired(created, now):
+                self._delete(key, size)
+                self._misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._remember(key, text, created)
+            self._disk_hits += 1
+            return text
+
+    def put(self, model_name, prompt, text, config=None):
+        key = cache_key(model_name, prompt, config)
+        now = time.time()
+        size = len(text.encode("utf-8"))
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, text, size, created, accessed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, text, size, now, now),
+            )
+            if old is None:
+                self._entries += 1
+            else:
+                self._bytes -= old[0]
+            self._bytes += size
+            self._remember(key, text, now)
+            self._evict()
+
+    def _delete(self, key, size):
+        self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._memory.pop(key, None)
+        self._entries -= 1
+        self._bytes -= size
+
+    def _evict(self):
+        """Drop least recently used rows until both limits are met."""
+        while self._entries > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes and self._entries > 1
+        ):
+            excess = max(1, self._entries - self.max_entries)
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT ?", (excess,)
+            ).fetchall()
+            for key, size in rows:
+                self._delete(key, size)
+                self._evictions += 1
+
+    def purge_expired(self):
+        """Delete every expired row; returns how many were removed."""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            cutoff = time.time() - self.ttl
+            rows = self._db.execute(
+                "SELECT key, size FROM responses WHERE created < ?", (cutoff,)
+            ).fetchall()
+            for key, size in rows:
+                self._delete(key, size)
+            return len(rows)
+
+    def generate(self, model, prompt, **kwargs):
+        """model.generate_content(prompt, **kwargs), answered from the cache when possible.
+
+        On a hit the result is a CachedResponse with only a .text attribute.
+        """
+        name = model_name_of(model)
+        config = kwargs or None
+        text = self.get(name, prompt, config)
+        if text is not None:
+            return CachedResponse(text)
+        response = model.generate_content(prompt, **kwargs)
+        self.put(name, prompt, response.text, config)
+        return response
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self._memory_hits, self._disk_hits, self._misses, self._evictions,
+                             len(self._memory), self._entries, self._bytes)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._memory.clear()
+            self._entries = self._bytes = 0
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
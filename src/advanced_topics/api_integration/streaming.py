@@ -0,0 +1,160 @@
+# Streaming responses
+# generate_content(prompt, stream=True) returns the answer in chunks as it is
+# produced. TextStream yields each chunk's text as soon as it arrives and
+# records how long the first chunk took, so long answers can be printed
+# while the rest is still being generated. Stopping early (break, close(),
+# or leaving a with block) stops reading the underlying stream. The stream
+# objects only keep a weak reference to their iterator, so a loop that is
+# left with break drops the last reference and the stream is closed at once
+# (for async streams, on the event loop's next step).
+
+import time
+import weakref
+from collections import namedtuple
+
+StreamStats = namedtuple(
+    "StreamStats", ["first_chunk_seconds", "total_seconds", "chunks", "characters", "completed"]
+)
+
+
+def _close(response):
+    close = getattr(response, "close", None)
+    if close is not None:
+        close()
+
+
+class _StreamBase:
+    def __init__(self, model, prompt, **kwargs):
+        self.model = model
+        self.prompt = prompt
+        self.kwargs = kwargs
+        self.parts = []
+        self.first_chunk_seconds = None
+        self.total_seconds = None
+        self.completed = False
+        self._start = None
+        self._iterator_ref = None
+
+    def _current(self):
+        """The live iterator, if a caller still holds one."""
+        return self._iterator_ref() if self._iterator_ref is not None else None
+
+    def _track(self, iterator):
+        self._iterator_ref = weakref.ref(iterator)
+        return iterator
+
+    def _chunk(self, chunk):
+        text = chunk.text
+        if self.first_chunk_seconds is None:
+            self.first_chunk_seconds = time.perf_counter() - self._start
+        self.parts.append(text)
+        return text
+
+    def _finish(self):
+        if self.total_seconds is None:
+            self.total_seconds = time.perf_counter() - self._start
+
+    @property
+    def text(self):
+        """Everything received so far."""
+        return "".join(self.parts)
+
+    def stats(self):
+        return StreamStats(self.first_chunk_seconds, self.total_seconds,
+                           len(self.parts), sum(map(len, self.parts)), self.completed)
+
+
+class TextStream(_StreamBase):
+    """Iterate over the text chunks of a streamed response.
+
+    stream = TextStream(model, "Write a factorial function")
+    for text in stream:
+        print(text, end="", flush=True)
+    print(stream.stats().first_chunk_seconds)
+    """
+
+    def __iter__(self):
+        iterator = self._current()
+        if iterator is not None:
+            return iterator
+        if self._start is not None:
+            # Already read or abandoned; a stream can't be replayed.
+            return iter(())
+        return self._track(self._iterate())
+
+    def _iterate(self):
+        self._start = time.perf_counter()
+        response = self.model.generate_content(self.prompt, stream=True, **self.kwargs)
+        try:
+            for chunk in response:
+                yield self._chunk(chunk)
+            self.completed = True
+        finally:
+            self._finish()
+            if not self.completed:
+                _close(response)
+
+    def close(self):
+        """Stop reading; safe to call at any time."""
+        iterator = self._current()
+        if iterator is not None:
+            iterator.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+async def _no_chunks():
+    return
+    yield
+
+
+async def _aclose(response):
+    aclose = getattr(response, "aclose", None)
+    if aclose is not None:
+        await aclose()
+    else:
+        _close(response)
+
+
+class AsyncTextStream(_StreamBase):
+    """async for version of TextStream, using generate_content_async().
+
+    async with AsyncTextStream(model, prompt) as stream:
+        async for text in stream:
+            print(text, end="", flush=True)
+    """
+
+    def __aiter__(self):
+        iterator = self._current()
+        if iterator is not None:
+            return iterator
+        if self._start is not None:
+            return _no_chunks()
+        return self._track(self._iterate())
+
+    async def _iterate(self):
+        self._start = time.perf_counter()
+        response = await self.model.generate_content_async(self.prompt, stream=True, **self.kwargs)
+        try:
+            async for chunk in response:
+                yield self._chunk(chunk)
+            self.completed = True
+        finally:
+            self._finish()
+            if not self.completed:
+                await _aclose(response)
+
+    async def aclose(self):
+        iterator = self._current()
+        if iterator is not None:
+            await iterator.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
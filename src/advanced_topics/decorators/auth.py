@@ -0,0 +1,176 @@
+# Role-based access decorator
+# Roles are compiled once into integer bitmasks (including the roles they
+# inherit), each user's mask is cached, and the check in the wrapper is a
+# single bitwise AND. Works on both regular and async functions.
+
+import functools
+import inspect
+import threading
+
+# role -> roles it includes; "admin" can do everything a "user" can, etc.
+ROLE_HIERARCHY = {
+    "admin": ("user",),
+    "user": ("guest",),
+    "guest": (),
+}
+
+
+class UserRoles(dict):
+    """username -> role mapping that notifies listeners whenever it changes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listeners = []
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def _changed(self):
+        for callback in self._listeners:
+            callback()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        super().update(other)
+        self._changed()
+        return self
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+
+class Permissions:
+    """Compiled role hierarchy plus a cache of each user's resolved mask."""
+
+    def __init__(self, hierarchy, roles):
+        self._lock = threading.Lock()
+        self._bits = {}
+        self._masks = {}
+        self._resolved = {}
+        self.roles = roles
+        roles.add_listener(self.invalidate)
+        self.set_hierarchy(hierarchy)
+
+    def _bit_locked(self, role):
+        # Bits are never reassigned, so decorators can keep the ones they hold.
+        bit = self._bits.get(role)
+        if bit is None:
+            bit = self._bits[role] = 1 << len(self._bits)
+            self._masks.setdefault(role, bit)
+        return bit
+
+    def bit_for(self, role):
+        """Return the bit that identifies `role`, assigning one if it is new."""
+        with self._lock:
+            return self._bit_locked(role)
+
+    def set_hierarchy(self, hierarchy):
+        """Compile role -> inherited roles into role -> bitmask."""
+        with self._lock:
+            masks = {}
+
+            def compile_role(role, visiting):
+                if role in masks:
+                    return masks[role]
+                if role in visiting:
+                    raise ValueError(f"Role hierarchy has a cycle through {role!r}")
+                visiting.add(role)
+                mask = self._bit_locked(role)
+                for inherited in hierarchy.get(role, ()):
+                    mask |= compile_role(inherited, visiting)
+                visiting.discard(role)
+                masks[role] = mask
+                return mask
+
+            for role in hierarchy:
+                compile_role(role, set())
+            self._masks = masks
+            self._resolved = {}
+
+    def invalidate(self):
+        """Forget cached user masks; called whenever `roles` changes."""
+        self._resolved = {}
+
+    def mask_for(self, username):
+        """Return the permission mask for `username` (0 if unknown)."""
+        resolved = self._resolved
+        mask = resolved.get(username)
+        if mask is None:
+            role = self.roles.get(username)
+            if role is None:
+                return 0
+            with self._lock:
+                mask = self._masks.get(role) or self._bit_locked(role)
+            # If roles changed meanwhile this lands in the discarded dict.
+            resolved[username] = mask
+        return mask
+
+
+user_roles = UserRoles()
+permissions = Permissions(ROLE_HIERARCHY, user_roles)
+
+
+def _deny(username, role, perms):
+    if username not in perms.roles:
+        print(f"Access Denied: {username} not found")
+    else:
+        print(f"Access Denied: {username} is not {role}")
+
+
+def require_auth(role, perms=None):
+    """Only call the function when its first argument is a user whose role
+    is `role` or inherits it. Denied calls return None.
+    """
+    perms = perms or permissions
+    required = perms.bit_for(role)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(username, *args, **kwargs):
+                mask = perms._resolved.get(username)
+                if mask is None:
+                    mask = perms.mask_for(username)
+                if mask & required:
+                    return await func(username, *args, **kwargs)
+                _deny(username, role, perms)
+                return None
+        else:
+            @functools.wraps(func)
+            def wrapper(username, *args, **kwargs):
+                mask = perms._resolved.get(username)
+                if mask is None:
+                    mask = perms.mask_for(username)
+                if mask & required:
+                    return func(username, *args, **kwargs)
+                _deny(username, role, perms)
+                return None
+        return wrapper
+    return decorator
@@ -0,0 +1,147 @@
+# Bounded memoization decorator
+# LRU eviction, optional per-entry TTL, thread-safe, with hit/miss counters.
+# Coroutine functions get an async wrapper that also de-duplicates concurrent
+# calls for the same key (single-flight).
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+_KWARGS_MARK = object()
+_MISSING = object()
+_FAST_KEY_TYPES = {int, str}
+
+
+def _make_key(args, kwargs):
+    """Build a hashable cache key from call arguments."""
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    if len(args) == 1 and type(args[0]) in _FAST_KEY_TYPES:
+        return args[0]
+    return args
+
+
+def memoize(func=None, *, maxsize=128, ttl=None):
+    """Cache results of `func` keyed on its positional and keyword arguments.
+
+    Can be used bare (@memoize) or with options (@memoize(maxsize=1024, ttl=60)).
+    maxsize=None means unbounded; ttl is in seconds. The wrapped function
+    gains cache_info() and cache_clear().
+
+    For async functions the result of the awaited coroutine is cached, and
+    callers that arrive while the same key is being computed wait for that
+    computation instead of starting their own (they count as hits).
+    """
+    if func is None:
+        return functools.partial(memoize, maxsize=maxsize, ttl=ttl)
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize must be None or >= 0")
+    if ttl is not None and ttl <= 0:
+        raise ValueError("ttl must be None or > 0")
+
+    # key -> (value, expires_at); most recently used entries are at the end
+    cache = OrderedDict()
+    lock = threading.Lock()
+    stats = {"hits": 0, "misses": 0, "evictions": 0}
+    clock = time.monotonic
+
+    def count(name):
+        with lock:
+            stats[name] += 1
+
+    def lookup(key, count_miss=True):
+        with lock:
+            entry = cache.get(key)
+            if entry is not None:
+                if ttl is None or entry[1] > clock():
+                    cache.move_to_end(key)
+                    stats["hits"] += 1
+                    return entry[0]
+                del cache[key]
+                stats["evictions"] += 1
+            if count_miss:
+                stats["misses"] += 1
+        return _MISSING
+
+    def store(key, result):
+        if maxsize == 0:
+            return
+        expires_at = clock() + ttl if ttl is not None else None
+        with lock:
+            cache[key] = (result, expires_at)
+            cache.move_to_end(key)
+            if maxsize is not None:
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    stats["evictions"] += 1
+
+    if inspect.iscoroutinefunction(func):
+        in_flight = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            result = lookup(key, count_miss=False)
+            if result is not _MISSING:
+                return result
+
+            loop = asyncio.get_running_loop()
+            pending = in_flight.get(key)
+            while pending is not None and pending.get_loop() is loop:
+                count("hits")
+                try:
+                    # shield() so one cancelled waiter doesn't cancel the others.
+                    return await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise
+                # The computing call was cancelled; the next caller takes over.
+                pending = in_flight.get(key)
+
+            count("misses")
+            pending = in_flight[key] = loop.create_future()
+            try:
+                result = await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                pending.cancel()
+                raise
+            except BaseException as exc:
+                pending.set_exception(exc)
+                pending.exception()  # mark retrieved when nobody was waiting
+                raise
+            else:
+                store(key, result)
+                pending.set_result(result)
+                return result
+            finally:
+                if in_flight.get(key) is pending:
+                    del in_flight[key]
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            result = lookup(key)
+            if result is not _MISSING:
+                return result
+            # Compute outside the lock so slow or recursive calls don't serialise.
+            result = func(*args, **kwargs)
+            store(key, result)
+            return result
+
+    def cache_info():
+        with lock:
+            return CacheInfo(stats["hits"], stats["misses"], stats["evictions"], maxsize, len(cache))
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            stats.update(hits=0, misses=0, evictions=0)
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
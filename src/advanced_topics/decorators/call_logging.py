@@ -0,0 +1,74 @@
+# Call logging decorator
+# Logs arguments and return values through the logging module. Messages use
+# lazy %-formatting, so nothing is formatted unless a handler will emit it.
+# Works on both regular and async functions.
+
+import functools
+import inspect
+import logging
+
+
+class _Truncated:
+    """Defers repr() of a value until logging formats the message."""
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        text = repr(self.value)
+        if len(text) > self.limit:
+            return f"{text[:self.limit]}...<{len(text) - self.limit} more chars>"
+        return text
+
+
+def log_calls(func=None, *, logger=None, level=logging.DEBUG,
+              max_arg_length=None, strip_if_disabled=False):
+    """Log every call to `func` with its arguments and return value.
+
+    logger defaults to the logger of the function's module. max_arg_length
+    truncates the repr of large arguments and results. With
+    strip_if_disabled=True the function is returned undecorated when the
+    logger isn't enabled for `level` at decoration time.
+    """
+    if func is None:
+        return functools.partial(log_calls, logger=logger, level=level,
+                                 max_arg_length=max_arg_length,
+                                 strip_if_disabled=strip_if_disabled)
+
+    log = logger or logging.getLogger(func.__module__)
+    if strip_if_disabled and not log.isEnabledFor(level):
+        return func
+
+    is_enabled = log.isEnabledFor
+    name = func.__name__
+    if max_arg_length is None:
+        def shown(value):
+            return value
+    else:
+        def shown(value):
+            return _Truncated(value, max_arg_length)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not is_enabled(level):
+                return await func(*args, **kwargs)
+            log.log(level, "Calling %s with args=%s, kwargs=%s",
+                    name, shown(args), shown(kwargs), stacklevel=2)
+            result = await func(*args, **kwargs)
+            log.log(level, "%s returned %s", name, shown(result), stacklevel=2)
+            return result
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_enabled(level):
+                return func(*args, **kwargs)
+            log.log(level, "Calling %s with args=%s, kwargs=%s",
+                    name, shown(args), shown(kwargs), stacklevel=2)
+            result = func(*args, **kwargs)
+            log.log(level, "%s returned %s", name, shown(result), stacklevel=2)
+            return result
+    return wrapper
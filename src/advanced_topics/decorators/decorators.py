@@ -1,13 +1,32 @@
+import asyncio
 import time
 import functools
+import inspect
+import logging
+
+from auth import require_auth, user_roles
+from caching import memoize
+from call_logging import log_calls
+from profiling import report, timed
 
 print("=== Basic Decorator ===")
 
 def timer_decorator(func):
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            result = await func(*args, **kwargs)
+            end_time = time.perf_counter()
+            print(f"{func.__name__} took {end_time - start_time:.4f} seconds")
+            return result
+        return async_wrapper
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         print(f"{func.__name__} took {end_time - start_time:.4f} seconds")
         return result
     return wrapper
@@ -22,24 +41,11 @@ print(f"Sum: {result}\n")
 
 print("=== Authentication Decorator ===")
 
-user_roles = {
+user_roles.update({
     "Surya": "admin",
     "Priya": "user",
     "Arjun": "guest"
-}
-
-def require_auth(role):
-    def decorator(func):
-        def wrapper(username, *args, **kwargs):
-            if username not in user_roles:
-                print(f"Access Denied: {username} not found")
-                return None
-            if user_roles[username] != role:
-                print(f"Access Denied: {username} is not {role}")
-                return None
-            return func(username, *args, **kwargs)
-        return wrapper
-    return decorator
+})
 
 @require_auth("admin")
 def delete_user(username, target_user):
@@ -54,17 +60,13 @@ def view_profile(username):
 delete_user("Surya", "old_user")
 delete_user("Priya", "old_user")
 view_profile("Priya")
+view_profile("Surya")  # admin inherits the user role
+view_profile("Arjun")
 
 print("\n=== Logging Decorator ===")
 
-def log_calls(func):
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        print(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
-        result = func(*args, **kwargs)
-        print(f"{func.__name__} returned {result}")
-        return result
-    return wrapper
+logging.basicConfig(format="%(message)s")
+logging.getLogger(__name__).setLevel(logging.DEBUG)
 
 @log_calls
 def add_marks(subject, marks):
@@ -95,18 +97,7 @@ print(greet("Surya"))
 
 print("\n=== Cache Decorator ===")
 
-def memoize(func):
-    cache = {}
-    def wrapper(n):
-        if n not in cache:
-            cache[n] = func(n)
-            print(f"Calculating for {n}...")
-        else:
-            print(f"Using cached value for {n}")
-        return cache[n]
-    return wrapper
-
-@memoize
+@memoize(maxsize=256)
 def fibonacci(n):
     if n < 2:
         return n
@@ -114,5 +105,43 @@ def fibonacci(n):
 
 print(f"Fib(5): {fibonacci(5)}")
 print(f"Fib(5): {fibonacci(5)}")
+print(f"Cache info: {fibonacci.cache_info()}")
+
+print("\n=== Profiling Decorator ===")
+
+@timed
+def square(x):
+    return x * x
+
+@timed(sample_rate=0.1)
+def cube(x):
+    return x * x * x
+
+for i in range(10000):
+    square(i)
+    cube(i)
+
+print(report())
+
+print("\n=== Async Decorators ===")
+
+@timer_decorator
+@log_calls
+async def fetch_marks(name):
+    await asyncio.sleep(0.1)
+    return 95
+
+@memoize
+async def load_profile(name):
+    await asyncio.sleep(0.1)
+    return {"name": name}
+
+async def run_async_examples():
+    await fetch_marks("Surya")
+    # Five concurrent calls for the same key share one computation
+    await asyncio.gather(*(load_profile("Priya") for _ in range(5)))
+    print(f"Async cache info: {load_profile.cache_info()}")
+
+asyncio.run(run_async_examples())
 
 print("\nDecorator examples completed!")
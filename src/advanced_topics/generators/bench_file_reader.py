@@ -0,0 +1,58 @@
+# Benchmark: line-by-line text iteration vs the mmap chunked reader
+# Usage: python bench_file_reader.py [number_of_lines]
+
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+
+from file_reader import iter_line_batches, read_lines
+
+
+def line_by_line(filename):
+    with open(filename, "r") as file:
+        for line in file:
+            yield line.strip()
+
+
+def consume(iterator):
+    deque(iterator, maxlen=0)
+
+
+def count_batches(filename, encoding=None):
+    for _, lines in iter_line_batches(filename, encoding=encoding):
+        consume(lines)
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    fd, path = tempfile.mkstemp(suffix=".log")
+    try:
+        with os.fdopen(fd, "w") as file:
+            for i in range(lines):
+                file.write(f"2026-10-18 12:00:{i % 60:02d} INFO request {i} served in {i % 997}ms\n")
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{lines} lines, {size_mb:.1f} MB")
+
+        cases = [
+            ("open() line by line, strip", lambda: consume(line_by_line(path))),
+            ("read_lines (mmap), strip", lambda: consume(read_lines(path))),
+            ("iter_line_batches, str", lambda: count_batches(path, "utf-8")),
+            ("iter_line_batches, bytes", lambda: count_batches(path)),
+        ]
+        baseline = None
+        for name, run in cases:
+            best = float("inf")
+            for _ in range(3):
+                start = time.perf_counter()
+                run()
+                best = min(best, time.perf_counter() - start)
+            baseline = baseline or best
+            print(f"{name:<30} {best:.3f}s  ({baseline / best:.2f}x)")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
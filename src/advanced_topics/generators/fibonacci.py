@@ -0,0 +1,74 @@
+# Fibonacci numbers in O(log n)
+# Fast doubling needs no recursion, so n is only limited by big-int size, and
+# an optional modulus keeps the numbers small for huge n.
+
+
+def fib_pair(n, mod=None):
+    """Return (F(n), F(n + 1)) using fast doubling.
+
+    F(2k)     = F(k) * (2 * F(k + 1) - F(k))
+    F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if mod is not None:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+        if mod is not None:
+            b %= mod
+    if mod is not None:
+        a %= mod
+    return a, b
+
+
+def fib(n, mod=None):
+    """Return F(n), or F(n) % mod when mod is given."""
+    return fib_pair(n, mod)[0]
+
+
+def _mat_mult(x, y, mod):
+    a = x[0] * y[0] + x[1] * y[2]
+    b = x[0] * y[1] + x[1] * y[3]
+    c = x[2] * y[0] + x[3] * y[2]
+    d = x[2] * y[1] + x[3] * y[3]
+    if mod is not None:
+        return a % mod, b % mod, c % mod, d % mod
+    return a, b, c, d
+
+
+def fib_matrix(n, mod=None):
+    """Return F(n) by squaring [[1, 1], [1, 0]]; same result as fib()."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    result = (1, 0, 0, 1)
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _mat_mult(result, base, mod)
+        base = _mat_mult(base, base, mod)
+        n >>= 1
+    return result[1] if mod is None else result[1] % mod
+
+
+def fib_range(lo, hi, mod=None):
+    """Yield F(lo), F(lo + 1), ..., F(hi - 1).
+
+    Jumps to lo with fast doubling, then steps forward with additions.
+    """
+    if lo >= hi:
+        return
+    a, b = fib_pair(lo, mod)
+    for _ in range(hi - lo):
+        yield a
+        if mod is None:
+            a, b = b, a + b
+        else:
+            a, b = b, (a + b) % mod
@@ -0,0 +1,153 @@
+# Memory-mapped chunked file reading
+# The file is mmap'd and cut into large windows that end on a newline, so
+# lines are split and decoded a whole window at a time instead of one by one.
+#
+# Every function takes a byte range [start, end). A line belongs to the range
+# that contains its first byte, so ranges never share or split a line and a
+# reader can resume from any offset it was handed back.
+#
+# Files that can't be mapped (pipes, /dev/stdin, /proc files that report a
+# size of 0) are read with ordinary buffered I/O under the same rules.
+
+import mmap
+import os
+import stat
+
+WINDOW_SIZE = 1 << 20  # 1 MiB keeps each decoded window cache-friendly
+
+
+def _open_map(filename):
+    """Return a read-only mmap of filename, or None if it can't be mapped."""
+    # stat() rather than open(): opening a pipe here would consume its writer,
+    # leaving nothing for the buffered reader that opens it next.
+    info = os.stat(filename)
+    if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+        return None
+    with open(filename, "rb") as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+
+def _buffered_batches(filename, start, end, window_size):
+    """Fallback for unmappable files: (next_offset, byte lines) batches."""
+    with open(filename, "rb") as file:
+        offset = 0
+        batch = []
+        size = 0
+        for line in file:
+            line_start = offset
+            offset += len(line)
+            if line_start < start:
+                continue
+            if end is not None and line_start >= end:
+                break
+            batch.append(line[:-1] if line.endswith(b"\n") else line)
+            size += len(line)
+            if size >= window_size:
+                yield offset, batch
+                batch = []
+                size = 0
+        if batch:
+            yield offset, batch
+
+
+def _line_aligned(mm, start, end):
+    """Move start and end forward to the beginning of the next line."""
+    size = len(mm)
+    end = size if end is None else min(end, size)
+    start = max(start, 0)
+    if 0 < start < size:
+        newline = mm.find(b"\n", start - 1)
+        start = size if newline == -1 else newline + 1
+    if 0 < end < size:
+        newline = mm.find(b"\n", end - 1)
+        end = size if newline == -1 else newline + 1
+    return start, end
+
+
+def _windows(mm, start, end, window_size):
+    """Yield (window_start, window_stop) pairs that each end on a newline."""
+    pos = start
+    while pos < end:
+        stop = min(pos + window_size, end)
+        if stop < end:
+            newline = mm.rfind(b"\n", pos, stop)
+            if newline == -1:
+                # One line is longer than the window; take all of it.
+                newline = mm.find(b"\n", stop, end)
+                stop = end if newline == -1 else newline + 1
+            else:
+                stop = newline + 1
+        yield pos, stop
+        pos = stop
+
+
+def iter_line_batches(filename, start=0, end=None, encoding=None, window_size=WINDOW_SIZE):
+    """Yield (next_offset, lines) for each window of the file.
+
+    lines are bytes without their b"\\n", or str when an ASCII-compatible
+    encoding is given. next_offset is where reading should resume after
+    this batch.
+    """
+    mm = _open_map(filename)
+    if mm is None:
+        for offset, lines in _buffered_batches(filename, start, end, window_size):
+            if encoding is not None:
+                lines = [line.decode(encoding) for line in lines]
+            yield offset, lines
+        return
+    with mm:
+        start, end = _line_aligned(mm, start, end)
+        for pos, stop in _windows(mm, start, end, window_size):
+            chunk = mm[pos:stop]
+            if encoding is None:
+                lines = chunk.split(b"\n")
+            else:
+                lines = chunk.decode(encoding).split("\n")
+            if not lines[-1]:
+                lines.pop()
+            yield stop, lines
+
+
+def read_lines(filename, start=0, end=None, encoding="utf-8", strip=True, window_size=WINDOW_SIZE):
+    """Yield the decoded lines of filename, stripped of surrounding whitespace
+    unless strip is False (then only the newline is removed).
+    """
+    for _, lines in iter_line_batches(filename, start, end, encoding, window_size):
+        if strip:
+            yield from map(str.strip, lines)
+        else:
+            yield from lines
+
+
+def iter_line_views(filename, start=0, end=None):
+    """Yield each line as a zero-copy memoryview into the mapped file.
+
+    A view is only valid until the next one is requested; copy it with
+    bytes(view) to keep it.
+    """
+    mm = _open_map(filename)
+    if mm is None:
+        for _, lines in _buffered_batches(filename, start, end, WINDOW_SIZE):
+            for line in lines:
+                yield memoryview(line)
+        return
+    with mm:
+        start, end = _line_aligned(mm, start, end)
+        data = memoryview(mm)
+        try:
+            find = mm.find
+            pos = start
+            while pos < end:
+                newline = find(b"\n", pos, end)
+                stop = end if newline == -1 else newline
+                view = data[pos:stop]
+                try:
+                    yield view
+                finally:
+                    view.release()
+                pos = stop + 1
+        finally:
+            data.release()
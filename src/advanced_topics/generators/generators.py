@@ -1,3 +1,8 @@
+from fibonacci import fib_pair, fib_range
+from file_reader import read_lines
+from pipeline import Pipeline
+from streaming_stats import stats_generator
+
 print("=== Basic Generator ===")
 
 def number_generator(n):
@@ -26,25 +31,21 @@ for result in student_marks_generator(students):
 print("\n=== Fibonacci Generator ===")
 
 def fibonacci_generator(limit):
-    a, b = 0, 1
-    count = 0
-    while count < limit:
-        yield a
-        a, b = b, a + b
-        count += 1
+    yield from fib_range(0, limit)
 
 print("First 10 Fibonacci numbers:")
 for fib in fibonacci_generator(10):
     print(fib, end=" ")
 print()
 
+print("Fibonacci numbers 100 to 102:", list(fib_range(100, 103)))
+print("F(10**18) mod 1,000,000,007:", fib_pair(10**18, mod=1_000_000_007)[0])
+
 print("\n=== File Reader Generator ===")
 
 def read_large_file(filename):
     try:
-        with open(filename, 'r') as file:
-            for line in file:
-                yield line.strip()
+        yield from read_lines(filename)
     except FileNotFoundError:
         yield "File not found"
 
@@ -92,6 +93,17 @@ for _ in range(5):
     print(next(counter), end=" ")
 print()
 
+print("\n=== Lazy Pipeline ===")
+
+squares_of_evens = (
+    Pipeline(counter_generator(1))
+    .filter(lambda n: n % 2 == 0)
+    .map(lambda n: n ** 2)
+    .batch(3)
+    .take(2)
+)
+print("\nFirst two batches of even squares:", list(squares_of_evens))
+
 print("\n=== Generator with Send ===")
 
 def average_generator():
@@ -112,4 +124,11 @@ print(f"\nAverage after 85: {avg_gen.send(85)}")
 print(f"Average after 92: {avg_gen.send(92)}")
 print(f"Average after 78: {avg_gen.send(78)}")
 
+stats_gen = stats_generator()
+next(stats_gen)
+stats_gen.send(85)
+stats = stats_gen.send([92, 78, 95, 88])
+print(f"\nMean: {stats.mean:.2f}, Std dev: {stats.stdev:.2f}, "
+      f"Min: {stats.min}, Max: {stats.max}, Median: {stats.quantile(0.5):.1f}")
+
 print("\nGenerator examples completed!")
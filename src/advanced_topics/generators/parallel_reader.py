@@ -0,0 +1,71 @@
+# Parallel line processing
+# The file is split into byte ranges and each worker process opens the file
+# and reads its own range with file_reader, so lines are never pickled on the
+# way in; only func's results travel back. Pipes and /proc files have no
+# size to split, so they are read serially.
+
+import os
+import stat
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from file_reader import read_lines
+
+# Enough tasks per worker to balance uneven ranges without tiny tasks.
+TASKS_PER_WORKER = 4
+MIN_CHUNK_SIZE = 1 << 20
+
+
+def byte_ranges(size, chunk_size):
+    """Split [0, size) into consecutive (start, end) ranges of chunk_size bytes.
+
+    The ranges don't have to fall on newlines: file_reader assigns each line
+    to the range holding its first byte.
+    """
+    return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+def _process_range(filename, start, end, func, encoding, strip):
+    return [func(line) for line in read_lines(filename, start, end, encoding, strip)]
+
+
+def parallel_lines(filename, func, workers=None, ordered=True, chunk_size=None,
+                   encoding="utf-8", strip=True):
+    """Yield func(line) for every line of filename, computed in a process pool.
+
+    func must be picklable (a module-level function). With ordered=True the
+    results come out in file order; otherwise each range's results are
+    yielded as soon as that range finishes.
+    """
+    workers = workers or os.cpu_count() or 1
+    info = os.stat(filename)
+    if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+        yield from map(func, read_lines(filename, encoding=encoding, strip=strip))
+        return
+    size = info.st_size
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-size // (workers * TASKS_PER_WORKER)))
+    ranges = byte_ranges(size, chunk_size)
+
+    if workers == 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            yield from _process_range(filename, start, end, func, encoding, strip)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            pool.submit(_process_range, filename, start, end, func, encoding, strip)
+            for start, end in ranges
+        ]
+        if ordered:
+            for future in futures:
+                yield from future.result()
+        else:
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+    finally:
+        # Stop queued ranges if the consumer gives up early.
+        pool.shutdown(wait=True, cancel_futures=True)
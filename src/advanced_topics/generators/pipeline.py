@@ -0,0 +1,219 @@
+# Lazy, composable generator pipelines
+# Stages are only recorded when the pipeline is built; items are pulled one at
+# a time when it is iterated, so unbounded sources work. Adjacent map/filter
+# stages are fused into a single generated loop to avoid one generator frame
+# per stage.
+
+import time
+from collections import deque
+from itertools import islice
+
+_MAP = "map"
+_FILTER = "filter"
+
+
+_fused_cache = {}
+
+
+def _compile_fused(kinds):
+    """Generate one generator function running a run of map/filter steps inline.
+
+    For ("map", "filter") this builds:
+
+        def fused(source, f0, f1):
+            for item in source:
+                item = f0(item)
+                if not f1(item):
+                    continue
+                yield item
+    """
+    fused = _fused_cache.get(kinds)
+    if fused is not None:
+        return fused
+    names = [f"f{index}" for index in range(len(kinds))]
+    lines = [f"def fused(source, {', '.join(names)}):", "    for item in source:"]
+    for kind, name in zip(kinds, names):
+        if kind == _MAP:
+            lines.append(f"        item = {name}(item)")
+        else:
+            lines.append(f"        if not {name}(item):")
+            lines.append("            continue")
+    lines.append("        yield item")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    fused = _fused_cache[kinds] = namespace["fused"]
+    return fused
+
+
+def _batch(source, size):
+    iterator = iter(source)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _window(source, size, step):
+    window = deque(maxlen=size)
+    pending = size
+    for item in source:
+        window.append(item)
+        pending -= 1
+        if pending == 0:
+            yield tuple(window)
+            pending = step
+
+
+def _dedupe(source, key, consecutive):
+    if consecutive:
+        previous = object()
+        for item in source:
+            marker = key(item) if key else item
+            if marker != previous:
+                previous = marker
+                yield item
+        return
+    seen = set()
+    for item in source:
+        marker = key(item) if key else item
+        if marker not in seen:
+            seen.add(marker)
+            yield item
+
+
+class _Meter:
+    """Counts items through one stage and the time spent producing them."""
+
+    __slots__ = ("_iterator", "stats")
+
+    def __init__(self, iterator, stats):
+        self._iterator = iterator
+        self.stats = stats
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            item = next(self._iterator)
+        finally:
+            self.stats["seconds"] += time.perf_counter() - start
+        self.stats["items"] += 1
+        return item
+
+
+class Pipeline:
+    """Chain map/filter/batch/window/take/dedupe stages over any iterable.
+
+    Every method returns a new Pipeline; nothing runs until it is iterated.
+    With profile=True fusion is turned off and stats() reports how many items
+    left each stage and the time spent in it.
+    """
+
+    def __init__(self, source, profile=False, _stages=()):
+        self._source = source
+        self._profile = profile
+        self._stages = tuple(_stages)
+        self._stats = []
+
+    def _then(self, kind, *params):
+        return Pipeline(self._source, self._profile, self._stages + ((kind, params),))
+
+    def map(self, func):
+        return self._then(_MAP, func)
+
+    def filter(self, predicate):
+        return self._then(_FILTER, predicate)
+
+    def batch(self, size):
+        if size < 1:
+            raise ValueError("batch size must be at least 1")
+        return self._then("batch", size)
+
+    def window(self, size, step=1):
+        if size < 1 or step < 1:
+            raise ValueError("window size and step must be at least 1")
+        return self._then("window", size, step)
+
+    def take(self, n):
+        return self._then("take", n)
+
+    def dedupe(self, key=None, consecutive=False):
+        """Drop repeated items. consecutive=True only compares neighbours,
+        which keeps memory constant on unbounded streams.
+        """
+        return self._then("dedupe", key, consecutive)
+
+    def _build(self, source, kind, params):
+        if kind == "batch":
+            return _batch(source, *params)
+        if kind == "window":
+            return _window(source, *params)
+        if kind == "take":
+            return islice(source, *params)
+        if kind == "dedupe":
+            return _dedupe(source, *params)
+        raise ValueError(f"Unknown stage {kind!r}")
+
+    def _fused_groups(self):
+        """Yield stages with runs of map/filter merged into ("fused", ops)."""
+        ops = []
+        for kind, params in self._stages:
+            if kind in (_MAP, _FILTER):
+                ops.append((kind, params[0]))
+                continue
+            if ops:
+                yield "fused", ops
+                ops = []
+            yield kind, params
+        if ops:
+            yield "fused", ops
+
+    def __iter__(self):
+        if self._profile:
+            return self._iter_profiled()
+        iterator = iter(self._source)
+        for kind, params in self._fused_groups():
+            if kind != "fused":
+                iterator = self._build(iterator, kind, params)
+            elif len(params) == 1:
+                # A lone map or filter can use the C builtin directly.
+                kind, func = params[0]
+                iterator = map(func, iterator) if kind == _MAP else filter(func, iterator)
+            else:
+                kinds, funcs = zip(*params)
+                iterator = _compile_fused(kinds)(iterator, *funcs)
+        return iterator
+
+    def _iter_profiled(self):
+        self._stats = [{"stage": "source", "items": 0, "seconds": 0.0}]
+        iterator = _Meter(iter(self._source), self._stats[0])
+        for kind, params in self._stages:
+            if kind == _MAP:
+                stage = map(params[0], iterator)
+            elif kind == _FILTER:
+                stage = filter(params[0], iterator)
+            else:
+                stage = self._build(iterator, kind, params)
+            stats = {"stage": kind, "items": 0, "seconds": 0.0}
+            self._stats.append(stats)
+            iterator = _Meter(stage, stats)
+        return iterator
+
+    def stats(self):
+        """Per-stage item counts and exclusive seconds from the last profiled run."""
+        report = []
+        upstream = 0.0
+        for stats in self._stats:
+            report.append({
+                "stage": stats["stage"],
+                "items": stats["items"],
+                "seconds": max(0.0, stats["seconds"] - upstream),
+            })
+            upstream = stats["seconds"]
+        return report
+
+    def collect(self):
+        return list(self)
@@ -0,0 +1,196 @@
+# Streaming statistics in constant memory
+# Count, mean and variance use Welford's update (Chan's formula for batches and
+# merges), so long streams don't lose precision the way total / count does.
+# Quantiles come from a small merging t-digest that can be combined too.
+
+import math
+import numbers
+
+
+class TDigest:
+    """Approximate quantiles from at most ~compression centroids.
+
+    Centroids near the tails are kept small (the k1 scale function), so
+    extreme quantiles like p99 stay accurate.
+    """
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self._centroids = []   # sorted [(mean, weight)]
+        self._buffer = []      # unsorted (mean, weight) waiting to be merged
+        self._buffer_limit = compression * 5
+        self.total_weight = 0.0
+
+    def add(self, value, weight=1.0):
+        self._buffer.append((value, weight))
+        self.total_weight += weight
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def add_many(self, values):
+        before = len(self._buffer)
+        self._buffer.extend((value, 1.0) for value in values)
+        self.total_weight += len(self._buffer) - before
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def merge(self, other):
+        other._compress()
+        self._buffer.extend(other._centroids)
+        self.total_weight += other.total_weight
+        self._compress()
+
+    def _k_limit(self, q):
+        """Largest cumulative fraction the current centroid may grow to."""
+        scale = self.compression / (2 * math.pi)
+        k = scale * math.asin(2 * q - 1) + 1
+        if k >= scale * math.pi / 2:
+            return 1.0
+        return (math.sin(k / scale) + 1) / 2
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        items = sorted(self._centroids + self._buffer)
+        self._buffer = []
+        total = self.total_weight
+        merged = []
+        mean, weight = items[0]
+        cumulative = 0.0
+        limit = self._k_limit(0.0)
+        for value, value_weight in items[1:]:
+            if (cumulative + weight + value_weight) / total <= limit:
+                weight += value_weight
+                mean += (value - mean) * value_weight / weight
+            else:
+                merged.append((mean, weight))
+                cumulative += weight
+                limit = self._k_limit(cumulative / total)
+                mean, weight = value, value_weight
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def quantile(self, q, low, high):
+        """Estimate the q-th quantile (0..1); low/high are the exact min/max."""
+        self._compress()
+        centroids = self._centroids
+        if not centroids:
+            return None
+        if q <= 0:
+            return low
+        if q >= 1:
+            return high
+        target = q * self.total_weight
+        # Each centroid's mean sits at the middle of its weight.
+        previous_position, previous_mean = 0.0, low
+        cumulative = 0.0
+        for mean, weight in centroids:
+            position = cumulative + weight / 2
+            if target <= position:
+                span = position - previous_position
+                if span <= 0:
+                    return mean
+                fraction = (target - previous_position) / span
+                return previous_mean + (mean - previous_mean) * fraction
+            previous_position, previous_mean = position, mean
+            cumulative += weight
+        span = self.total_weight - previous_position
+        fraction = (target - previous_position) / span if span > 0 else 1.0
+        return previous_mean + (high - previous_mean) * fraction
+
+
+class StreamingStats:
+    """Running count, mean, variance, min, max and quantiles of a stream."""
+
+    def __init__(self, compression=100):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self._digest = TDigest(compression)
+
+    def update(self, value):
+        """Add one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self._digest.add(value)
+
+    def update_many(self, values):
+        """Add a batch of values in one pass."""
+        values = list(values)
+        if not values:
+            return
+        count = len(values)
+        mean = math.fsum(values) / count
+        m2 = math.fsum([(value - mean) ** 2 for value in values])
+        self._combine(count, mean, m2, min(values), max(values))
+        self._digest.add_many(values)
+
+    def merge(self, other):
+        """Fold another StreamingStats (e.g. from another shard) into this one."""
+        if other.count:
+            self._combine(other.count, other.mean, other._m2, other.min, other.max)
+            self._digest.merge(other._digest)
+        return self
+
+    def _combine(self, count, mean, m2, low, high):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    @property
+    def variance(self):
+        """Sample variance (n - 1 denominator)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def population_variance(self):
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        """Approximate q-th quantile, 0 <= q <= 1."""
+        return self._digest.quantile(q, self.min, self.max)
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+def stats_generator(compression=100):
+    """Coroutine version: send() a number or a batch, get the stats back.
+
+    Sending None stops it.
+    """
+    stats = StreamingStats(compression)
+    while True:
+        value = yield stats
+        if value is None:
+            break
+        # Any real number (Fraction, NumPy scalars, ...) is a single value.
+        if isinstance(value, numbers.Real):
+            stats.update(value)
+        else:
+            stats.update_many(value)
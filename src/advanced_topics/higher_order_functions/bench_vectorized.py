@@ -0,0 +1,55 @@
+# Benchmark: the hof.py sales pipeline in pure Python vs the NumPy backend
+# Usage: python bench_vectorized.py [size ...]
+
+import random
+import sys
+import time
+from functools import reduce
+
+from vectorized import Chain, np
+
+
+def python_pipeline(sales):
+    high_sales = filter(lambda x: x > 2000, sales)
+    discounted = map(lambda x: x * 0.9, high_sales)
+    return reduce(lambda x, y: x + y, discounted)
+
+
+def chain_pipeline(sales, use_numpy):
+    return (
+        Chain(sales, use_numpy=use_numpy)
+        .filter(lambda x: x > 2000)
+        .map(lambda x: x * 0.9)
+        .reduce("sum")
+    )
+
+
+def best_of(run, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 6, 10 ** 7]
+    if np is None:
+        print("NumPy is not installed; only the pure Python path can be timed.")
+    for size in sizes:
+        rng = random.Random(size)
+        sales = [rng.randint(100, 6000) for _ in range(size)]
+        baseline = best_of(lambda: python_pipeline(sales))
+        print(f"n={size:,}")
+        print(f"  map/filter/reduce       {baseline:.3f}s")
+        if np is not None:
+            listed = best_of(lambda: chain_pipeline(sales, True))
+            array = np.asarray(sales)
+            resident = best_of(lambda: chain_pipeline(array, True))
+            print(f"  Chain, list input       {listed:.3f}s  ({baseline / listed:.1f}x)")
+            print(f"  Chain, ndarray input    {resident:.3f}s  ({baseline / resident:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
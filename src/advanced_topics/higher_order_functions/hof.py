@@ -1,5 +1,8 @@
 from functools import reduce
 
+from parallel_reduce import parallel_reduce
+from vectorized import Chain
+
 print("=== Map Function ===")
 
 numbers = [1, 2, 3, 4, 5]
@@ -65,6 +68,14 @@ total_revenue = reduce(lambda x, y: x + y, discounted)
 print(f"Sales: {sales}")
 print(f"Total revenue (high sales with 10% discount): ₹{total_revenue:.2f}")
 
+vectorized = Chain(sales, use_numpy=True).filter(lambda x: x > 2000).map(lambda x: x * 0.9)
+print(f"Same pipeline on the {vectorized.backend} backend: ₹{vectorized.reduce('sum'):.2f}")
+
+# Large inputs are split into chunks reduced in a process pool; this small list
+# stays serial. "kahan" compensates for the rounding error of float additions.
+revenue = parallel_reduce("kahan", map(lambda x: x * 0.9, filter(lambda x: x > 2000, sales)))
+print(f"Compensated revenue via parallel_reduce: ₹{revenue:.2f}")
+
 print("\n=== Practical Example: Student Data Processing ===")
 
 students = [
@@ -0,0 +1,180 @@
+# Parallel reduce
+# reduce() walks the data strictly left to right. When the operation is
+# associative, the data can be cut into chunks, each chunk reduced in a
+# worker, and the partial results combined pairwise in a tree. Chunks keep
+# their order, so the operation does not have to be commutative.
+
+import math
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce as _reduce
+from itertools import chain, islice, repeat
+
+# Below this many items the pool costs more than it saves.
+SERIAL_THRESHOLD = 50_000
+DEFAULT_CHUNK_SIZE = 1 << 16
+CHUNKS_PER_WORKER = 4
+
+_MISSING = object()
+
+
+def _kahan_partial(values):
+    """Return (total, compensation) for values (Neumaier's variant of Kahan)."""
+    total = 0.0
+    compensation = 0.0
+    for value in values:
+        running = total + value
+        if abs(total) >= abs(value):
+            compensation += (total - running) + value
+        else:
+            compensation += (value - running) + total
+        total = running
+    return total, compensation
+
+
+def _kahan_combine(left, right):
+    total = left[0] + right[0]
+    if abs(left[0]) >= abs(right[0]):
+        error = (left[0] - total) + right[0]
+    else:
+        error = (right[0] - total) + left[0]
+    return total, left[1] + right[1] + error
+
+
+def _kahan_finish(partial):
+    return partial[0] + partial[1]
+
+
+def kahan_sum(values):
+    """Sum floats while carrying the rounding error of each addition.
+
+    kahan_sum([0.1] * 10) == 1.0, where sum() gives 0.9999999999999999.
+    """
+    return _kahan_finish(_kahan_partial(values))
+
+
+def _add_all(chunk):
+    # sum() is much faster than reduce(operator.add) but only for numbers.
+    if isinstance(chunk[0], (int, float)):
+        return sum(chunk)
+    return _reduce(operator.add, chunk)
+
+
+def _identity(value):
+    return value
+
+
+def _kahan_start(value):
+    return float(value), 0.0
+
+
+# name: (reduce one chunk, combine two partials, partial -> result, value -> partial)
+_COMBINERS = {
+    "sum": (_add_all, operator.add, _identity, _identity),
+    "product": (math.prod, operator.mul, _identity, _identity),
+    "max": (max, max, _identity, _identity),
+    "min": (min, min, _identity, _identity),
+    "kahan": (_kahan_partial, _kahan_combine, _kahan_finish, _kahan_start),
+}
+_ALIASES = {operator.add: "sum", operator.mul: "product", max: "max", min: "min"}
+
+
+def _reduce_chunk(func, chunk, initial=_MISSING):
+    if initial is _MISSING:
+        return _reduce(func, chunk)
+    return _reduce(func, chunk, initial)
+
+
+def _chunks(iterator, size):
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _tree_combine(partials, combiner):
+    """Combine neighbouring partials level by level, keeping their order."""
+    while len(partials) > 1:
+        paired = [combiner(partials[i], partials[i + 1]) for i in range(0, len(partials) - 1, 2)]
+        if len(partials) % 2:
+            paired.append(partials[-1])
+        partials = paired
+    return partials[0]
+
+
+def parallel_reduce(func, iterable, combiner=None, workers=None, chunk_size=None,
+                    executor="process", initial=_MISSING):
+    """reduce(func, iterable) computed chunk by chunk in a worker pool.
+
+    func is a binary function, or one of "sum", "product", "max", "min" and
+    "kahan" (compensated float sum). operator.add, operator.mul, max and min
+    are recognised too and use the fast built-in chunk reducers.
+
+    combiner merges two chunk results and defaults to func; it must be
+    associative. Pass a separate combiner when func folds items into an
+    accumulator of another type, e.g.
+
+        parallel_reduce(lambda total, s: total + s["marks"], students,
+                        combiner=operator.add, initial=0)
+
+    Every chunk is then folded starting from initial, so initial is required
+    and must be an identity for combiner (0 for addition, 1 for products).
+    Without a combiner, initial is applied once, as in functools.reduce.
+
+    executor is "process" (func and the items must be picklable, so no
+    lambdas) or "thread" (only faster when func releases the GIL). Inputs
+    shorter than SERIAL_THRESHOLD are reduced in the calling process.
+    """
+    if isinstance(func, str):
+        if func not in _COMBINERS:
+            raise ValueError(f"Unknown reduction {func!r}")
+        if combiner is not None:
+            raise ValueError(f"The built-in {func!r} reduction has its own combiner")
+    seeded = combiner is not None
+    if seeded and initial is _MISSING:
+        raise TypeError("a separate combiner needs an initial value to start each chunk from")
+    name = func if isinstance(func, str) else _ALIASES.get(func)
+    if name is not None and not seeded:
+        chunk_reducer, combiner, finish, start = _COMBINERS[name]
+    else:
+        chunk_reducer = None
+        combiner = combiner or func
+        finish = start = _identity
+
+    iterator = iter(iterable)
+    head = list(islice(iterator, SERIAL_THRESHOLD))
+    workers = workers or os.cpu_count() or 1
+    if len(head) < SERIAL_THRESHOLD or workers == 1:
+        head.extend(iterator)
+        partials = []
+        if seeded:
+            # Exactly functools.reduce: one fold starting from initial.
+            return _reduce(func, head, initial)
+        if head:
+            partials.append(chunk_reducer(head) if chunk_reducer else _reduce(func, head))
+    else:
+        if chunk_size is None:
+            try:
+                size = len(iterable)
+            except TypeError:
+                size = 0
+            chunk_size = max(DEFAULT_CHUNK_SIZE, -(-size // (workers * CHUNKS_PER_WORKER)))
+        chunks = _chunks(chain(head, iterator), chunk_size)
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers=workers) as pool:
+            if chunk_reducer is not None:
+                partials = list(pool.map(chunk_reducer, chunks))
+            elif seeded:
+                partials = list(pool.map(_reduce_chunk, repeat(func), chunks, repeat(initial)))
+            else:
+                partials = list(pool.map(_reduce_chunk, repeat(func), chunks))
+        if seeded:
+            return _tree_combine(partials, combiner) if partials else initial
+
+    if initial is not _MISSING:
+        partials.insert(0, start(initial))
+    if not partials:
+        raise TypeError("reduce() of empty iterable with no initial value")
+    return finish(_tree_combine(partials, combiner))
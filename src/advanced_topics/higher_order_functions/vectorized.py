@@ -0,0 +1,181 @@
+# Vectorized map / filter / reduce
+# With use_numpy=True, numeric chains over homogeneous sequences run as NumPy
+# array operations when NumPy is installed; anything else falls back to plain
+# map/filter/reduce.
+#
+# map and filter functions are first called once with the whole array, which
+# works for arithmetic and comparison lambdas such as `lambda x: x * 0.9` or
+# `lambda x: x > 2000`. If that raises or doesn't return an array of the
+# right shape, or hits a floating point error such as division by zero, the
+# chain switches to Python for the rest of the way. Avoid functions with side
+# effects, since they may run on the array before the fallback.
+
+import operator
+from functools import reduce as _reduce
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_MISSING = object()
+# Integer overflow is silent in NumPy; products of ints always use Python.
+_INT64_LIMIT = 2 ** 63 - 1
+# Integer maps are checked against the same function on float64, which only
+# has 53 bits of precision, so results this close to the limit are redone in
+# Python.
+_INT64_MAP_LIMIT = 2 ** 62
+
+
+def _reducers():
+    if np is None:
+        return {}
+    return {
+        operator.add: np.add,
+        operator.mul: np.multiply,
+        max: np.maximum,
+        min: np.minimum,
+        "sum": np.add,
+        "product": np.multiply,
+        "max": np.maximum,
+        "min": np.minimum,
+    }
+
+
+_PYTHON_REDUCERS = {
+    "sum": operator.add,
+    "product": operator.mul,
+    "max": lambda x, y: x if x > y else y,
+    "min": lambda x, y: x if x < y else y,
+}
+
+
+def _as_numeric_array(data):
+    if np is None:
+        return None
+    if isinstance(data, np.ndarray):
+        array = data
+    else:
+        if not isinstance(data, (list, tuple, range)):
+            return None
+        try:
+            array = np.asarray(data)
+        except (ValueError, TypeError, OverflowError):
+            return None
+    if array.ndim != 1 or array.dtype.kind not in "biuf":
+        return None
+    return array
+
+
+class Chain:
+    """A map/filter/reduce chain that uses NumPy when it can.
+
+    Chain(sales, use_numpy=True).filter(lambda x: x > 2000).map(lambda x: x * 0.9)
+
+    NumPy is optional: by default the chain is plain Python, and
+    use_numpy=True switches to arrays when NumPy is installed and the data
+    is numeric. backend reports which path is currently in use. Integer maps
+    whose results could overflow 64 bits fall back to Python.
+    """
+
+    def __init__(self, data, use_numpy=False):
+        array = _as_numeric_array(data) if use_numpy else None
+        self._array = array
+        self._items = data if array is None else None
+
+    @property
+    def backend(self):
+        return "python" if self._array is None else "numpy"
+
+    def _to_python(self):
+        if self._array is not None:
+            self._items = self._array.tolist()
+            self._array = None
+
+    def _apply(self, func, expected_bool):
+        # Division by zero, overflow and invalid operations raise instead of
+        # giving inf/nan, so the Python path can raise what plain map would.
+        try:
+            with np.errstate(divide="raise", over="raise", invalid="raise"):
+                result = func(self._array)
+        except Exception:
+            return None
+        if not isinstance(result, np.ndarray) or result.shape != self._array.shape:
+            return None
+        if expected_bool and result.dtype != np.bool_:
+            return None
+        if not expected_bool and result.dtype.kind not in "biuf":
+            return None
+        if not expected_bool and result.dtype.kind in "iu" and self._array.dtype.kind in "biu":
+            if not self._fits_int64(func):
+                return None
+        return result
+
+    def _fits_int64(self, func):
+        """Run func on a float64 copy to see whether the integer result wrapped."""
+        try:
+            with np.errstate(divide="raise", over="raise", invalid="raise"):
+                mirror = np.asarray(func(self._array.astype(np.float64)), dtype=np.float64)
+        except Exception:
+            return False
+        if mirror.shape != self._array.shape:
+            return False
+        return mirror.size == 0 or bool(np.all(np.abs(mirror) < _INT64_MAP_LIMIT))
+
+    def map(self, func):
+        if self._array is not None:
+            result = self._apply(func, expected_bool=False)
+            if result is not None:
+                self._array = result
+                return self
+            self._to_python()
+        self._items = map(func, self._items)
+        return self
+
+    def filter(self, predicate):
+        if self._array is not None:
+            mask = self._apply(predicate, expected_bool=True)
+            if mask is not None:
+                self._array = self._array[mask]
+                return self
+            self._to_python()
+        self._items = filter(predicate, self._items)
+        return self
+
+    def reduce(self, func, initial=_MISSING):
+        """Reduce with a function or one of "sum", "product", "max", "min".
+
+        Only these known associative operations are vectorized.
+        """
+        if self._array is not None:
+            ufunc = _reducers().get(func)
+            if ufunc is not None and self._numpy_safe(ufunc):
+                if self._array.size == 0:
+                    if initial is _MISSING:
+                        raise TypeError("reduce() of empty iterable with no initial value")
+                    return initial
+                result = ufunc.reduce(self._array).item()
+                return result if initial is _MISSING else _PYTHON_REDUCERS.get(func, func)(initial, result)
+            self._to_python()
+        func = _PYTHON_REDUCERS.get(func, func)
+        if initial is _MISSING:
+            return _reduce(func, self._items)
+        return _reduce(func, self._items, initial)
+
+    def _numpy_safe(self, ufunc):
+        if self._array.dtype.kind == "f" or ufunc in (np.maximum, np.minimum):
+            return True
+        if ufunc is np.multiply:
+            return False
+        if self._array.size == 0:
+            return True
+        largest = max(abs(int(self._array.max())), abs(int(self._array.min())))
+        return largest * self._array.size <= _INT64_LIMIT
+
+    def to_list(self):
+        if self._array is not None:
+            return self._array.tolist()
+        return list(self._items)
+
+    def __iter__(self):
+        return iter(self.to_list())
@@ -1,3 +1,5 @@
+from ranking import rank, running_top_k, top_k
+
 print("=== Basic Lambda Functions ===")
 
 add = lambda x, y: x + y
@@ -23,6 +25,16 @@ print("Students sorted by marks:")
 for student in students_sorted:
     print(f"{student['name']}: {student['marks']}")
 
+# For a leaderboard only the top few are needed, which a bounded heap finds
+# without sorting everything. "marks" is used as an itemgetter key.
+print("Top 2 students:", [s["name"] for s in top_k(students, 2, key="marks")])
+for position, student in rank(students + [{"name": "Meera", "marks": 92}], key="marks"):
+    print(f"{position}. {student['name']}: {student['marks']}")
+
+batches = [[45, 12, 78], [90, 3], [66, 91, 20]]
+for best in running_top_k(batches, 2):
+    print(f"Top 2 so far: {best}")
+
 print("\n=== Lambda with Conditional ===")
 
 grade = lambda marks: "Pass" if marks >= 40 else "Fail"
@@ -0,0 +1,129 @@
+# Ranking without a full sort
+# Getting the best k of n items only needs a heap of size k, which is
+# O(n log k) instead of the O(n log n) of sorted(). key can be a function or,
+# for lists of dicts, a field name such as "marks", which is turned into an
+# operator.itemgetter (implemented in C, faster than lambda s: s["marks"]).
+
+import heapq
+from itertools import count, groupby
+from operator import itemgetter
+
+
+def _resolve_key(key):
+    """Turn a field name (or tuple of names) into an itemgetter."""
+    if key is None or callable(key):
+        return key
+    if isinstance(key, tuple):
+        return itemgetter(*key)
+    return itemgetter(key)
+
+
+def top_k(iterable, k, key=None, largest=True):
+    """Return the k largest (or smallest) items, best first.
+
+    Ties keep their original order, like sorted().
+    top_k(students, 3, key="marks") is
+    sorted(students, key=lambda s: s["marks"], reverse=True)[:3].
+    """
+    if k <= 0:
+        return []
+    pick = heapq.nlargest if largest else heapq.nsmallest
+    return pick(k, iterable, key=_resolve_key(key))
+
+
+class _Reversed:
+    """Wraps a key so the heap orders it backwards (for smallest-k)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class RunningTopK:
+    """Keeps the top k of a stream that arrives in batches.
+
+    Memory stays at k items however much data is fed in.
+    """
+
+    def __init__(self, k, key=None, largest=True):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.largest = largest
+        self._key = _resolve_key(key)
+        # Min-heap of (key, -arrival, item): the root is the entry to evict.
+        # Among equal keys the newest arrival is evicted first.
+        self._heap = []
+        self._arrivals = count()
+        self.seen = 0
+
+    def add(self, item):
+        self.update((item,))
+
+    def update(self, batch):
+        """Feed a batch (any iterable) of items."""
+        heap, k = self._heap, self.k
+        key = self._key
+        wrap = None if self.largest else _Reversed
+        arrivals = self._arrivals
+        seen = 0
+        for item in batch:
+            seen += 1
+            value = item if key is None else key(item)
+            if wrap is not None:
+                value = wrap(value)
+            if len(heap) < k:
+                heapq.heappush(heap, (value, -next(arrivals), item))
+            elif heap[0][0] < value:
+                # Equal keys never replace an earlier item, so they are
+                # skipped before building an entry.
+                heapq.heapreplace(heap, (value, -next(arrivals), item))
+        self.seen += seen
+        return self
+
+    def items(self):
+        """Current top k, best first."""
+        return [entry[2] for entry in sorted(self._heap, reverse=True)]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+def running_top_k(batches, k, key=None, largest=True):
+    """Yield the top k so far after each batch in `batches`."""
+    tracker = RunningTopK(k, key, largest)
+    for batch in batches:
+        yield tracker.update(batch).items()
+
+
+def rank(iterable, key=None, largest=True, k=None, method="competition"):
+    """Return [(rank, item), ...] best first, giving tied items the same rank.
+
+    method "competition" ranks 95, 92, 92, 88 as 1, 2, 2, 4; "dense" as
+    1, 2, 2, 3; "ordinal" as 1, 2, 3, 4. With k, only the first k items are
+    ranked, using top_k() instead of a full sort.
+    """
+    if method not in ("competition", "dense", "ordinal"):
+        raise ValueError(f"Unknown rank method {method!r}")
+    key = _resolve_key(key)
+    if k is not None:
+        ordered = top_k(iterable, k, key, largest)
+    else:
+        ordered = sorted(iterable, key=key, reverse=largest)
+    if method == "ordinal":
+        return list(enumerate(ordered, 1))
+    ranked = []
+    position = 0
+    for dense, (_, group) in enumerate(groupby(ordered, key=key), 1):
+        group = list(group)
+        current = dense if method == "dense" else position + 1
+        ranked.extend((current, item) for item in group)
+        position += len(group)
+    return ranked
@@ -0,0 +1,196 @@
+# Non-blocking logging
+# A QueueHandler only puts records on a queue, so logger.info() in a request
+# thread never waits for the disk. A background QueueListener takes records
+# off the queue in batches and hands them to the real handlers; handlers with
+# emit_batch() (BatchStreamHandler, BatchFileHandler) write a whole batch with
+# one write and one flush.
+#
+# The queue is bounded. When it is full, overflow decides what happens:
+#   "block"       the caller waits for space (nothing is lost)
+#   "drop_new"    the new record is discarded
+#   "drop_oldest" the oldest queued record is discarded to make room
+# Dropped records are counted in handler.dropped.
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+OVERFLOW_POLICIES = ("block", "drop_new", "drop_oldest")
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler with a bounded queue and an overflow policy."""
+
+    def __init__(self, maxsize=10_000, overflow="block"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, not {overflow!r}")
+        super().__init__(queue.Queue(maxsize))
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record):
+        # The queue never leaves this process, so QueueHandler's format-and-copy
+        # (done to make records picklable) is skipped. Only the arguments are
+        # merged now, since they could change before the listener runs.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                if self.overflow == "drop_new":
+                    self.dropped += 1
+                    return
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+
+
+class _BatchWriteMixin:
+    """emit_batch() for StreamHandler subclasses: one write, one flush."""
+
+    def emit_batch(self, records):
+        text = []
+        for record in records:
+            if record.levelno < self.level or not self.filter(record):
+                continue
+            try:
+                text.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if not text:
+            return
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write("".join(text))
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+
+class BatchStreamHandler(_BatchWriteMixin, logging.StreamHandler):
+    pass
+
+
+class BatchFileHandler(_BatchWriteMixin, logging.FileHandler):
+    pass
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener that drains up to batch_size records per wake-up."""
+
+    def __init__(self, queue, *handlers, batch_size=256):
+        super().__init__(queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def enqueue_sentinel(self):
+        # The queue may be full; waiting is fine here, the thread is draining it.
+        self.queue.put(self._sentinel)
+
+    def handle_batch(self, records):
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            emit_batch = getattr(handler, "emit_batch", None)
+            if emit_batch is not None:
+                emit_batch(records)
+                continue
+            for record in records:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+    def _monitor(self):
+        q = self.queue
+        sentinel = self._sentinel
+        stop = False
+        while not stop:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            if sentinel in batch:
+                stop = True
+                batch = [record for record in batch if record is not sentinel]
+            if batch:
+                self.handle_batch(batch)
+            for _ in range(len(batch) + stop):
+                q.task_done()
+
+
+class AsyncLogging:
+    """Route `logger` through a bounded queue to `handlers` on a background thread.
+
+    with AsyncLogging([BatchFileHandler("app.log")], overflow="drop_oldest"):
+        logging.info("written by the listener thread")
+
+    stop() (or leaving the with block) writes everything still queued and
+    removes the queue handler again.
+    """
+
+    def __init__(self, handlers, logger=None, level=None, maxsize=10_000,
+                 overflow="block", batch_size=256):
+        self.logger = logger if isinstance(logger, logging.Logger) else logging.getLogger(logger)
+        self.level = level
+        self.handlers = list(handlers)
+        self.queue_handler = BoundedQueueHandler(maxsize, overflow)
+        self.listener = BatchingQueueListener(
+            self.queue_handler.queue, *self.handlers, batch_size=batch_size
+        )
+        self._running = False
+
+    @property
+    def dropped(self):
+        return self.queue_handler.dropped
+
+    def start(self):
+        if not self._running:
+            if self.level is not None:
+                self.logger.setLevel(self.level)
+            self.logger.addHandler(self.queue_handler)
+            self.listener.start()
+            self._running = True
+        return self
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        self.logger.removeHandler(self.queue_handler)
+        self.listener.stop()
+        if self.dropped:
+            record = self.logger.makeRecord(
+                self.logger.name, logging.WARNING, __file__, 0,
+                "%d log records were dropped because the queue was full", (self.dropped,), None,
+            )
+            self.listener.handle_batch([record])
+        for handler in self.handlers:
+            handler.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def setup_async_logging(handlers, logger=None, level=logging.INFO, maxsize=10_000,
+                        overflow="block", batch_size=256):
+    """Start an AsyncLogging and stop it (flushing the queue) at exit."""
+    async_logging = AsyncLogging(handlers, logger, level, maxsize, overflow, batch_size).start()
+    atexit.register(async_logging.stop)
+    return async_logging
@@ -2,6 +2,9 @@ import logging
 import os
 from datetime import datetime
 
+from async_logging import BatchFileHandler, setup_async_logging
+from rotating_logs import CompressingRotatingFileHandler
+
 print("=== Basic Logging ===")
 
 logging.basicConfig(level=logging.INFO)
@@ -48,7 +51,7 @@ logging.basicConfig(
     format='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S',
     handlers=[
-        logging.FileHandler(os.path.join(log_dir, "detailed.log")),
+        CompressingRotatingFileHandler(os.path.join(log_dir, "detailed.log"), max_bytes=1024 * 1024),
         logging.StreamHandler()
     ],
     force=True
@@ -76,7 +79,14 @@ print("\n=== Custom Logger with Multiple Handlers ===")
 student_logger = logging.getLogger("StudentLogger")
 student_logger.setLevel(logging.DEBUG)
 
-file_handler = logging.FileHandler(os.path.join(log_dir, "students.log"))
+# Rotates at 1 MB (or daily) and gzips old files in the background, keeping
+# at most 10 MB of them.
+file_handler = CompressingRotatingFileHandler(
+    os.path.join(log_dir, "students.log"),
+    max_bytes=1024 * 1024,
+    interval=24 * 3600,
+    backup_bytes=10 * 1024 * 1024,
+)
 file_handler.setLevel(logging.INFO)
 
 console_handler = logging.StreamHandler()
@@ -128,4 +138,19 @@ manager.add_student("Priya", 88)
 manager.get_student("Surya")
 manager.get_student("Unknown")
 
+print("\n=== Non-blocking Logging ===")
+
+# add_student() now only puts records on a queue; a background thread writes
+# them to the file in batches.
+async_handler = BatchFileHandler(os.path.join(log_dir, "async.log"))
+async_handler.setFormatter(formatter)
+async_logging = setup_async_logging([async_handler], logger="StudentManager", overflow="drop_oldest")
+manager.logger.propagate = False
+
+for i in range(1000):
+    manager.add_student(f"Student{i}", i % 100)
+
+async_logging.stop()
+print(f"Logged 2000 messages to async.log ({async_logging.dropped} dropped)")
+
 print(f"\nLogging examples completed! Check logs in '{log_dir}/' directory")
@@ -0,0 +1,152 @@
+# Rotating, compressing log files
+# CompressingRotatingFileHandler starts a new file once the current one
+# reaches max_bytes or is `interval` seconds old. The full file is renamed
+# to name.log.<timestamp> (a rename is all the logging thread does) and a
+# background thread compresses it, then deletes the oldest segments while
+# they take up more than backup_bytes.
+#
+# Segments are named by time rather than numbered, so nothing has to be
+# renamed while the compressor may still be working on an older file. The
+# stamp is UTC, so names sort in rotation order even across DST changes.
+
+import glob
+import gzip
+import os
+import queue
+import shutil
+import threading
+import time
+from logging.handlers import BaseRotatingHandler
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+
+
+def _open_compressed(path, compression):
+    if compression == "zstd" and zstd is not None:
+        return path + ".zst", zstd.open
+    return path + ".gz", gzip.open
+
+
+class _Compressor:
+    """One background thread that compresses segments in the order given."""
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, job):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="log-compressor", daemon=True)
+                self._thread.start()
+        self._jobs.put(job)
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except OSError:
+                pass
+            finally:
+                self._jobs.task_done()
+
+    def wait(self):
+        """Block until every submitted segment has been handled."""
+        self._jobs.join()
+
+
+_compressor = _Compressor()
+
+
+class CompressingRotatingFileHandler(BaseRotatingHandler):
+    """A FileHandler that rotates by size and/or age and compresses old files.
+
+    compression is "gzip", "zstd" (gzip when the interpreter has no
+    compression.zstd) or None to keep segments as they are. backup_bytes
+    limits the total size of rotated segments; None keeps them all.
+    """
+
+    def __init__(self, filename, max_bytes=10 * 1024 * 1024, interval=None,
+                 backup_bytes=100 * 1024 * 1024, compression="gzip",
+                 encoding=None, delay=False):
+        if compression not in ("gzip", "zstd", None):
+            raise ValueError(f"Unknown compression {compression!r}")
+        super().__init__(filename, "a", encoding=encoding, delay=delay)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_bytes = backup_bytes
+        self.compression = compression
+        self.rollover_at = self._next_rollover()
+
+    def _next_rollover(self):
+        if not self.interval:
+            return None
+        try:
+            started = os.path.getmtime(self.baseFilename)
+        except OSError:
+            started = time.time()
+        return started + self.interval
+
+    def shouldRollover(self, record):
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        if not self.max_bytes:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        message = f"{self.format(record)}\n"
+        return self.stream.tell() + len(message) >= self.max_bytes
+
+    def segments(self):
+        """Rotated files for this log, oldest first."""
+        return sorted(glob.glob(glob.escape(self.baseFilename) + ".*"))
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename):
+            now = time.time_ns()
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime(now // 1_000_000_000))
+            segment = f"{self.baseFilename}.{stamp}-{now % 1_000_000_000:09d}"
+            os.replace(self.baseFilename, segment)
+            _compressor.submit(lambda: self._finish_segment(segment))
+        if not self.delay:
+            self.stream = self._open()
+        self.rollover_at = time.time() + self.interval if self.interval else None
+
+    def _finish_segment(self, segment):
+        """Runs on the compressor thread: compress, then apply retention."""
+        if self.compression is not None:
+            target, opener = _open_compressed(segment, self.compression)
+            partial = target + ".tmp"
+            with open(segment, "rb") as source, opener(partial, "wb") as compressed:
+                shutil.copyfileobj(source, compressed, 1024 * 1024)
+            os.replace(partial, target)
+            os.remove(segment)
+        self._enforce_retention()
+
+    def _enforce_retention(self):
+        if self.backup_bytes is None:
+            return
+        segments = [path for path in self.segments() if not path.endswith(".tmp")]
+        sizes = {path: os.path.getsize(path) for path in segments}
+        total = sum(sizes.values())
+        for path in segments:
+            if total <= self.backup_bytes:
+                break
+            os.remove(path)
+            total -= sizes[path]
+
+    def flush_compression(self):
+        """Wait until rotated segments are compressed (used by tests and close)."""
+        _compressor.wait()
+
+    def close(self):
+        super().close()
+        self.flush_compression()
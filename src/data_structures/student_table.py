@@ -0,0 +1,196 @@
+# Columnar student records
+# Instead of a list of {"name": ..., "marks": ...} dicts, names are kept in one
+# list and marks in a packed array('d'). A student with several marks is
+# stored "ragged": all marks in one array, plus offsets saying where each
+# student's marks start. Column operations use NumPy when it is installed
+# (viewing the same memory, no copy) and plain loops otherwise.
+
+import heapq
+import math
+from array import array
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class StudentTable:
+    """A column-oriented table of student names and marks.
+
+    marks holds one score per student, or, when offsets is given, every
+    student's marks back to back with student i owning
+    marks[offsets[i]:offsets[i + 1]]. Extra per-student columns (for
+    example "section") can be passed in columns. Methods that need a single
+    number per student use scores(): the mark itself, or the mean of a
+    student's marks for ragged tables.
+    """
+
+    def __init__(self, names, marks, offsets=None, columns=None):
+        self.names = list(names)
+        self.marks = marks if isinstance(marks, array) else array("d", marks)
+        self.offsets = None
+        if offsets is not None:
+            self.offsets = offsets if isinstance(offsets, array) else array("q", offsets)
+            if len(self.offsets) != len(self.names) + 1:
+                raise ValueError("offsets must have one more entry than names")
+        elif len(self.marks) != len(self.names):
+            raise ValueError("marks must have one entry per name")
+        self.columns = {key: list(values) for key, values in (columns or {}).items()}
+        for key, values in self.columns.items():
+            if len(values) != len(self.names):
+                raise ValueError(f"column {key!r} must have one entry per name")
+        self._scores = None
+
+    @property
+    def is_ragged(self):
+        return self.offsets is not None
+
+    @classmethod
+    def from_records(cls, records, name_key="name", marks_key="marks"):
+        """Build a table from dicts such as {"name": "Surya", "marks": 95}
+        or {"name": "Surya", "marks": [85, 90, 88]}.
+        """
+        records = list(records)
+        names = [record[name_key] for record in records]
+        columns = {}
+        for key in records[0] if records else ():
+            if key not in (name_key, marks_key):
+                columns[key] = [record.get(key) for record in records]
+        ragged = bool(records) and not isinstance(records[0][marks_key], (int, float))
+        if not ragged:
+            return cls(names, array("d", [record[marks_key] for record in records]), columns=columns)
+        marks = array("d")
+        offsets = array("q", [0])
+        for record in records:
+            marks.extend(record[marks_key])
+            offsets.append(len(marks))
+        return cls(names, marks, offsets, columns)
+
+    def _record(self, index, name_key="name", marks_key="marks"):
+        record = {name_key: self.names[index]}
+        if self.offsets is None:
+            record[marks_key] = self.marks[index]
+        else:
+            record[marks_key] = self.marks[self.offsets[index]:self.offsets[index + 1]].tolist()
+        for key, values in self.columns.items():
+            record[key] = values[index]
+        return record
+
+    def to_records(self, name_key="name", marks_key="marks"):
+        """Convert back to the list-of-dicts form."""
+        return [self._record(i, name_key, marks_key) for i in range(len(self))]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        return self._record(index)
+
+    def scores(self):
+        """One number per student: the mark, or the mean mark if ragged.
+
+        Returns an ndarray when NumPy is available, else an array('d').
+        """
+        if self._scores is not None:
+            return self._scores
+        if self.offsets is None:
+            scores = np.frombuffer(self.marks, dtype=np.float64) if np is not None and self.marks else self.marks
+        elif np is not None and len(self):
+            values = np.frombuffer(self.marks, dtype=np.float64) if self.marks else np.zeros(0)
+            offsets = np.frombuffer(self.offsets, dtype=np.int64)
+            running = np.concatenate(([0.0], np.cumsum(values)))
+            totals = running[offsets[1:]] - running[offsets[:-1]]
+            counts = np.diff(offsets)
+            with np.errstate(invalid="ignore"):
+                scores = totals / counts
+        else:
+            marks, offsets = self.marks, self.offsets
+            scores = array("d", (
+                math.fsum(marks[offsets[i]:offsets[i + 1]]) / (offsets[i + 1] - offsets[i])
+                if offsets[i + 1] > offsets[i] else math.nan
+                for i in range(len(self))
+            ))
+        self._scores = scores
+        return scores
+
+    def take(self, indices):
+        """Return a new table with the rows at `indices`, in that order."""
+        if np is not None and isinstance(indices, np.ndarray):
+            indices = indices.tolist()
+        else:
+            indices = list(indices)
+        names = list(map(self.names.__getitem__, indices))
+        columns = {key: list(map(values.__getitem__, indices)) for key, values in self.columns.items()}
+        if self.offsets is None:
+            if np is not None and self.marks and indices:
+                selected = np.frombuffer(self.marks, dtype=np.float64)[indices]
+                return StudentTable(names, array("d", selected.tobytes()), columns=columns)
+            return StudentTable(names, array("d", map(self.marks.__getitem__, indices)), columns=columns)
+        marks = array("d")
+        offsets = array("q", [0])
+        for i in indices:
+            marks.extend(self.marks[self.offsets[i]:self.offsets[i + 1]])
+            offsets.append(len(marks))
+        return StudentTable(names, marks, offsets, columns)
+
+    def filter(self, predicate):
+        """Keep students whose score satisfies predicate, e.g. lambda s: s >= 90.
+
+        With NumPy the predicate is called once on the whole score column.
+        """
+        scores = self.scores()
+        if np is not None and isinstance(scores, np.ndarray):
+            try:
+                mask = predicate(scores)
+            except Exception:
+                mask = None
+            if isinstance(mask, np.ndarray) and mask.dtype == np.bool_ and mask.shape == scores.shape:
+                return self.take(np.flatnonzero(mask))
+        return self.take(compress(range(len(self)), map(predicate, scores)))
+
+    def sort_by(self, column="marks", reverse=False):
+        """Return a new table sorted by score ("marks") or by another column."""
+        if column == "marks":
+            scores = self.scores()
+            if np is not None and isinstance(scores, np.ndarray):
+                order = np.argsort(-scores if reverse else scores, kind="stable")
+            else:
+                order = sorted(range(len(self)), key=scores.__getitem__, reverse=reverse)
+        else:
+            values = self.names if column == "name" else self.columns[column]
+            order = sorted(range(len(self)), key=values.__getitem__, reverse=reverse)
+        return self.take(order)
+
+    def top_k(self, k, largest=True):
+        """Return the k best (or worst) students by score, best first."""
+        k = max(0, min(k, len(self)))
+        if k == 0:
+            return self.take([])
+        scores = self.scores()
+        if np is not None and isinstance(scores, np.ndarray):
+            keyed = -scores if largest else scores
+            part = np.argpartition(keyed, k - 1)[:k]
+            order = part[np.argsort(keyed[part], kind="stable")]
+        else:
+            pick = heapq.nlargest if largest else heapq.nsmallest
+            order = pick(k, range(len(self)), key=scores.__getitem__)
+        return self.take(order)
+
+    def group_by_mean(self, column):
+        """Return {value of column: mean score of the students with it}."""
+        labels = self.names if column == "name" else self.columns[column]
+        groups = {}
+        inverse = [groups.setdefault(label, len(groups)) for label in labels]
+        scores = self.scores()
+        if np is not None and isinstance(scores, np.ndarray) and len(self):
+            totals = np.bincount(inverse, weights=scores, minlength=len(groups))
+            counts = np.bincount(inverse, minlength=len(groups))
+        else:
+            totals = [0.0] * len(groups)
+            counts = [0] * len(groups)
+            for group, score in zip(inverse, scores):
+                totals[group] += score
+                counts[group] += 1
+        return {label: float(totals[group] / counts[group]) for label, group in groups.items()}
@@ -9,17 +9,17 @@
 # for fruit in fruits:
 #     print(fruit)
 
-n = int(input("Enter a number: "))
+import argparse
+
+from prime_report import PrimeReportWriter
+from primes import iter_segments
 
-for num in range(2, n + 1):
-    is_prime = True
+parser = argparse.ArgumentParser(description="Classify 2..n as prime or not.")
+parser.add_argument("--quiet", action="store_true", help="only print a summary")
+args = parser.parse_args()
 
-    for i in range(2, int(num ** 0.5) + 1):
-        if num % i == 0:
-            is_prime = False
-            break
+n = int(input("Enter a number: "))
 
-    if is_prime:
-        print(num, "is a Prime Number")
-    else:
-        print(num, "is Not a Prime Number")
\ No newline at end of file
+with PrimeReportWriter(summary=args.quiet) as report:
+    for start, flags in iter_segments(2, n + 1):
+        report.add_segment(start, flags)
@@ -0,0 +1,148 @@
+# Multi-process prime classification
+# Segments of [0, n] are sieved in a process pool and each worker writes its
+# result bits straight into a shared-memory bitmap, so nothing per-number is
+# ever pickled back to the parent.
+
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from primes import SEGMENT_SIZE, _simple_sieve, _sieve_segment
+
+_worker_state = {}
+
+
+def pack_flags(flags):
+    """Pack a bytearray of 0/1 flags into bits, least significant bit first."""
+    nbytes = (len(flags) + 7) // 8
+    packed = 0
+    for bit in range(8):
+        lane = flags[bit::8]
+        packed |= int.from_bytes(lane, "little") << bit
+    return packed.to_bytes(nbytes, "little")
+
+
+def _attach(name):
+    """Attach to an existing shared memory block without owning its lifetime."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no track flag. Pool workers share the parent's
+        # resource tracker, so registering the same name again is harmless.
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(shm_name, base_limit):
+    _worker_state["shm"] = _attach(shm_name)
+    _worker_state["base_primes"] = _simple_sieve(base_limit)
+
+
+def _sieve_task(lo, hi):
+    flags = _sieve_segment(lo, hi, _worker_state["base_primes"])
+    packed = pack_flags(flags)
+    start = lo // 8
+    _worker_state["shm"].buf[start:start + len(packed)] = packed
+    return flags.count(1)
+
+
+class PrimeBitmap:
+    """Bitmap of primality for 0..n backed by shared memory.
+
+    Use as a context manager (or call close()) to release the block.
+    """
+
+    def __init__(self, n, shm, prime_count, elapsed):
+        self.n = n
+        self.prime_count = prime_count
+        self.elapsed = elapsed
+        self._shm = shm
+
+    @property
+    def throughput(self):
+        """Numbers classified per second."""
+        if self.elapsed <= 0:
+            return float("inf")
+        return (self.n + 1) / self.elapsed
+
+    def is_prime(self, k):
+        if k < 0 or k > self.n:
+            raise ValueError(f"{k} is outside the sieved range 0..{self.n}")
+        return bool(self._shm.buf[k >> 3] >> (k & 7) & 1)
+
+    def __contains__(self, k):
+        return 0 <= k <= self.n and self.is_prime(k)
+
+    def __iter__(self):
+        buf = self._shm.buf
+        for index in range((self.n >> 3) + 1):
+            byte = buf[index]
+            while byte:
+                low = byte & -byte
+                k = (index << 3) + low.bit_length() - 1
+                if k > self.n:
+                    return
+                yield k
+                byte ^= low
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def parallel_sieve(n, workers=None, segment_size=SEGMENT_SIZE):
+    """Classify 0..n across `workers` processes and return a PrimeBitmap."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    workers = workers or os.cpu_count() or 1
+    # Segments must start on byte boundaries so workers never share a byte.
+    segment_size = max(8, (segment_size + 7) // 8 * 8)
+    limit = n + 1
+    shm = shared_memory.SharedMemory(create=True, size=(limit + 7) // 8)
+    try:
+        start_time = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shm.name, math.isqrt(n)),
+        ) as pool:
+            futures = [
+                pool.submit(_sieve_task, lo, min(lo + segment_size, limit))
+                for lo in range(0, limit, segment_size)
+            ]
+            prime_count = sum(future.result() for future in futures)
+        elapsed = time.perf_counter() - start_time
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return PrimeBitmap(n, shm, prime_count, elapsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify 2..n as prime or not in parallel.")
+    parser.add_argument("n", type=int)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--segment-size", type=int, default=SEGMENT_SIZE,
+                        help="numbers sieved per task (rounded up to a multiple of 8)")
+    args = parser.parse_args(argv)
+
+    with parallel_sieve(args.n, args.workers, args.segment_size) as bitmap:
+        print(f"Primes up to {args.n}: {bitmap.prime_count}")
+        print(f"Classified {args.n + 1} numbers in {bitmap.elapsed:.3f} seconds "
+              f"({bitmap.throughput:,.0f} numbers/sec)")
+
+
+if __name__ == "__main__":
+    main()
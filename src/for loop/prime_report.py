@@ -0,0 +1,81 @@
+# Buffered output for the prime scripts
+# Lines are formatted a whole segment at a time and written in large chunks
+# instead of one print() call per number.
+
+import sys
+
+# Indexed by the sieve flag (0 or 1); matches print(num, "is ... Number").
+_LINE_SUFFIX = (" is Not a Prime Number\n", " is a Prime Number\n")
+
+
+class PrimeReportWriter:
+    """Collects prime classifications and writes them out in large chunks.
+
+    With summary=True no per-number lines are written; close() prints the
+    counts and the last prime instead.
+    """
+
+    def __init__(self, out=None, summary=False, buffer_size=1 << 20):
+        self._out = out if out is not None else sys.stdout
+        self._summary = summary
+        self._buffer_size = buffer_size
+        self._parts = []
+        self._pending = 0
+        self.checked = 0
+        self.prime_count = 0
+        self.last_prime = None
+
+    def add(self, num, is_prime):
+        """Record a single classification."""
+        self.checked += 1
+        if is_prime:
+            self.prime_count += 1
+            self.last_prime = num
+        if not self._summary:
+            line = f"{num}{_LINE_SUFFIX[bool(is_prime)]}"
+            self._parts.append(line)
+            self._pending += len(line)
+            if self._pending >= self._buffer_size:
+                self.flush()
+
+    def add_segment(self, start, flags):
+        """Record a sieve segment where flags[i] says whether start + i is prime."""
+        size = len(flags)
+        self.checked += size
+        primes = flags.count(1)
+        if primes:
+            self.prime_count += primes
+            self.last_prime = start + flags.rfind(1)
+        if not self._summary:
+            text = "".join(map(
+                str.__add__,
+                map(str, range(start, start + size)),
+                map(_LINE_SUFFIX.__getitem__, flags),
+            ))
+            self._parts.append(text)
+            self._pending += len(text)
+            if self._pending >= self._buffer_size:
+                self.flush()
+
+    def flush(self):
+        if self._parts:
+            self._out.write("".join(self._parts))
+            self._parts.clear()
+            self._pending = 0
+        self._out.flush()
+
+    def close(self):
+        self.flush()
+        if self._summary:
+            self._out.write(
+                f"Checked {self.checked} numbers\n"
+                f"Prime Numbers found: {self.prime_count}\n"
+                f"Last Prime Number: {self.last_prime}\n"
+            )
+            self._out.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,156 @@
+# Prime number utilities
+# A segmented Sieve of Eratosthenes replaces per-number trial division.
+
+import argparse
+import math
+from itertools import compress
+
+# One segment is a bytearray of this many flags (~256 KiB), small enough to
+# stay in cache while every base prime crosses it off.
+SEGMENT_SIZE = 1 << 18
+
+
+def _simple_sieve(limit):
+    """Return all primes <= limit using a plain (unsegmented) sieve."""
+    if limit < 2:
+        return []
+    flags = bytearray(b"\x01") * (limit + 1)
+    flags[0] = flags[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return list(compress(range(limit + 1), flags))
+
+
+def _sieve_segment(lo, hi, base_primes):
+    """Return a bytearray where flags[i] is 1 iff lo + i is prime, for [lo, hi)."""
+    size = hi - lo
+    flags = bytearray(b"\x01") * size
+    for p in base_primes:
+        square = p * p
+        if square >= hi:
+            break
+        start = max(square, (lo + p - 1) // p * p) - lo
+        flags[start::p] = bytes(len(range(start, size, p)))
+    for i in range(max(0, min(2 - lo, size))):
+        flags[i] = 0
+    return flags
+
+
+def iter_segments(lo, hi, segment_size=SEGMENT_SIZE):
+    """Yield (segment_start, flags) pairs covering [lo, hi) in order."""
+    lo = max(lo, 0)
+    if hi <= lo:
+        return
+    base_primes = _simple_sieve(math.isqrt(hi - 1))
+    for start in range(lo, hi, segment_size):
+        end = min(start + segment_size, hi)
+        yield start, _sieve_segment(start, end, base_primes)
+
+
+def iter_primes(lo, hi, segment_size=SEGMENT_SIZE):
+    """Yield every prime p with lo <= p < hi, using bounded memory."""
+    for start, flags in iter_segments(lo, hi, segment_size):
+        yield from compress(range(start, start + len(flags)), flags)
+
+
+def iter_classified(lo, hi, segment_size=SEGMENT_SIZE):
+    """Yield (number, is_prime) for every number in [lo, hi)."""
+    for start, flags in iter_segments(lo, hi, segment_size):
+        yield from zip(range(start, start + len(flags)), map(bool, flags))
+
+
+def primes_up_to(n):
+    """Return a list of all primes <= n."""
+    return list(iter_primes(2, n + 1))
+
+
+# Trial division by these catches most composites before Miller-Rabin runs.
+_SMALL_PRIMES = tuple(_simple_sieve(200))
+_SMALL_PRIME_SQUARE = _SMALL_PRIMES[-1] ** 2
+
+# Testing against the first twelve primes as witnesses is deterministic for
+# every n < 3.3 * 10**24, which covers all 64-bit integers.
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def _miller_rabin(n):
+    """Strong probable-prime test of an odd n > 2 against _WITNESSES."""
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in _WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n):
+    """Return True if n is prime.
+
+    Exact for n < 3.3 * 10**24; above that a False is still exact and a True
+    is a strong probable prime.
+    """
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < _SMALL_PRIME_SQUARE:
+        return True
+    return _miller_rabin(n)
+
+
+# Batches of small numbers are cheaper to answer from one sieve than one by one,
+# but only when the batch is dense: sieving up to the largest number costs
+# about that many bytes and steps, however few numbers were asked about.
+_BATCH_SIEVE_LIMIT = 1 << 24
+_BATCH_SIEVE_DENSITY = 16
+
+
+def is_prime_many(numbers):
+    """Return a list of is_prime results for every number in `numbers`."""
+    numbers = list(numbers)
+    if not numbers:
+        return []
+    largest = max(numbers)
+    if (len(numbers) > 64 and 2 <= largest < _BATCH_SIEVE_LIMIT
+            and largest <= _BATCH_SIEVE_DENSITY * len(numbers)):
+        flags = _sieve_segment(0, largest + 1, _simple_sieve(math.isqrt(largest)))
+        return [n >= 0 and bool(flags[n]) for n in numbers]
+    small_primes = _SMALL_PRIMES
+    results = []
+    for n in numbers:
+        if n < 2:
+            results.append(False)
+            continue
+        for p in small_primes:
+            if n % p == 0:
+                results.append(n == p)
+                break
+        else:
+            results.append(n < _SMALL_PRIME_SQUARE or _miller_rabin(n))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check whether numbers are prime.")
+    parser.add_argument("numbers", type=int, nargs="+")
+    args = parser.parse_args(argv)
+
+    for num, prime in zip(args.numbers, is_prime_many(args.numbers)):
+        if prime:
+            print(num, "is a Prime Number")
+        else:
+            print(num, "is Not a Prime Number")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,22 +6,27 @@
 #     print(i)
 #     i += 1
 
-n = int(input("Enter a number: "))
+import argparse
+
+from prime_report import PrimeReportWriter
+from primes import iter_primes
 
-num = 2
-while num <= n:
-    i = 2
-    is_prime = True
+parser = argparse.ArgumentParser(description="Classify 2..n as prime or not.")
+parser.add_argument("--quiet", action="store_true", help="only print a summary")
+args = parser.parse_args()
+
+n = int(input("Enter a number: "))
 
-    while i <= int(num ** 0.5):
-        if num % i == 0:
-            is_prime = False
-            break
-        i += 1
+primes = iter_primes(2, n + 1)
+next_prime = next(primes, None)
 
-    if is_prime:
-        print(num, "is a Prime Number")
-    else:
-        print(num, "is Not a Prime Number")
+with PrimeReportWriter(summary=args.quiet) as report:
+    num = 2
+    while num <= n:
+        if num == next_prime:
+            report.add(num, True)
+            next_prime = next(primes, None)
+        else:
+            report.add(num, False)
 
-    num +=1
+        num += 1
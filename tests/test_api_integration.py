@@ -0,0 +1,414 @@
+import pytest
+import asyncio
+import sys
+import os
+import time
+import types
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'advanced_topics', 'api_integration')))
+
+from async_client import AsyncGeminiClient, TokenBucket, is_transient
+from response_cache import ResponseCache, cache_key
+from streaming import AsyncTextStream, TextStream
+from chat_session import ChatManager, ChatSession, drop_oldest, summarize_with
+import gemini_client
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+class ResourceExhausted(Exception):
+    pass
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel: answers after a short delay."""
+
+    def __init__(self, delay=0.01, failures=None):
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures.get(prompt):
+                error = self.failures[prompt]
+                if isinstance(error, list):
+                    raise error.pop()
+                raise error
+            return FakeResponse(prompt.upper())
+        finally:
+            self.in_flight -= 1
+
+class BlockingFakeModel:
+    def generate_content(self, prompt):
+        time.sleep(0.01)
+        return FakeResponse(prompt[::-1])
+
+def test_results_in_prompt_order_with_bounded_concurrency():
+    model = FakeModel()
+    client = AsyncGeminiClient(model, max_concurrency=3)
+    prompts = [f"question {i}" for i in range(10)]
+    responses = client.run_many(prompts)
+    assert [response.text for response in responses] == [prompt.upper() for prompt in prompts]
+    assert model.max_in_flight == 3
+    assert client.stats == {"requests": 10, "retries": 0, "failures": 0}
+
+def test_blocking_model_runs_in_threads():
+    client = AsyncGeminiClient(BlockingFakeModel(), max_concurrency=4)
+    assert [r.text for r in client.run_many(["abc", "xyz"])] == ["cba", "zyx"]
+
+def test_transient_errors_are_retried():
+    model = FakeModel(failures={"flaky": [ResourceExhausted("quota"), ConnectionError("reset")]})
+    client = AsyncGeminiClient(model, base_delay=0.001)
+    assert client.run_many(["flaky"])[0].text == "FLAKY"
+    assert model.calls == ["flaky"] * 3
+    assert client.stats["retries"] == 2
+
+def test_permanent_errors_are_not_retried():
+    model = FakeModel(failures={"bad": ValueError("invalid prompt")})
+    client = AsyncGeminiClient(model, base_delay=0.001)
+    results = client.run_many(["ok", "bad"], return_exceptions=True)
+    assert results[0].text == "OK"
+    assert isinstance(results[1], ValueError)
+    assert model.calls.count("bad") == 1
+    with pytest.raises(ValueError):
+        client.run_many(["bad"])
+
+def test_retries_give_up_after_max_retries():
+    model = FakeModel(failures={"down": TimeoutError("slow")})
+    client = AsyncGeminiClient(model, max_retries=2, base_delay=0.001)
+    with pytest.raises(TimeoutError):
+        client.run_many(["down"])
+    assert len(model.calls) == 3
+    assert client.stats["failures"] == 1
+
+def test_is_transient():
+    assert is_transient(ResourceExhausted())
+    assert is_transient(ConnectionResetError())
+    error = Exception("server")
+    error.code = 503
+    assert is_transient(error)
+    assert not is_transient(ValueError())
+
+def test_token_bucket_limits_rate():
+    async def main():
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - start
+    assert asyncio.run(main()) >= 0.09
+
+def test_client_rate_limit():
+    client = AsyncGeminiClient(FakeModel(delay=0), requests_per_second=50, burst=1)
+    start = time.monotonic()
+    client.run_many(["a", "b", "c", "d", "e", "f"])
+    assert time.monotonic() - start >= 0.09
+
+class CountingModel:
+    model_name = "models/fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        return FakeResponse(f"answer to {prompt}")
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache.sqlite3")
+
+def test_cache_key_ignores_config_order():
+    assert cache_key("m", "p", {"a": 1, "b": 2}) == cache_key("m", "p", {"b": 2, "a": 1})
+    assert cache_key("m", "p") != cache_key("m2", "p")
+    assert cache_key("m", "p", {"temperature": 0}) != cache_key("m", "p")
+
+def test_cache_generate_hits_memory_then_disk(cache_path):
+    model = CountingModel()
+    with ResponseCache(cache_path) as cache:
+        assert cache.generate(model, "What is Python?").text == "answer to What is Python?"
+        assert cache.generate(model, "What is Python?").text == "answer to What is Python?"
+        assert model.calls == 1
+        info = cache.cache_info()
+        assert (info.memory_hits, info.misses, info.disk_size) == (1, 1, 1)
+    # A new cache (a new run) finds the answer on disk.
+    with ResponseCache(cache_path) as cache:
+        assert cache.generate(model, "What is Python?").text == "answer to What is Python?"
+        assert model.calls == 1
+        assert cache.cache_info().disk_hits == 1
+
+def test_cache_ttl(cache_path):
+    with ResponseCache(cache_path, ttl=0.05) as cache:
+        cache.put("m", "p", "old")
+        assert cache.get("m", "p") == "old"
+        time.sleep(0.06)
+        assert cache.get("m", "p") is None
+        cache.put("m", "q", "x")
+        time.sleep(0.06)
+        assert cache.purge_expired() == 1
+        assert cache.cache_info().disk_size == 0
+
+def test_cache_evicts_least_recently_used(cache_path):
+    with ResponseCache(cache_path, memory_size=0, max_entries=2) as cache:
+        cache.put("m", "a", "1")
+        cache.put("m", "b", "2")
+        time.sleep(0.01)
+        assert cache.get("m", "a") == "1"
+        cache.put("m", "c", "3")
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "a") == "1"
+        assert cache.cache_info().evictions == 1
+    with ResponseCache(cache_path, max_bytes=10) as cache:
+        cache.put("m", "d", "x" * 8)
+        assert cache.cache_info().disk_bytes <= 10
+
+def test_client_uses_cache(cache_path):
+    model = FakeModel(delay=0)
+    with ResponseCache(cache_path) as cache:
+        client = AsyncGeminiClient(model, cache=cache)
+        client.run_many(["a", "b"])
+        assert [r.text for r in client.run_many(["b", "a", "c"])] == ["B", "A", "C"]
+        assert model.calls == ["a", "b", "c"]
+
+class FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+class StreamingFakeModel:
+    """Yields the prompt's words one at a time, like stream=True."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.sent = 0
+        self.closed = False
+
+    def _words(self, prompt):
+        return [word + " " for word in prompt.split()]
+
+    def generate_content(self, prompt, stream=False):
+        assert stream
+        def chunks():
+            try:
+                for word in self._words(prompt):
+                    time.sleep(self.delay)
+                    self.sent += 1
+                    yield FakeChunk(word)
+            finally:
+                self.closed = True
+        return chunks()
+
+    async def generate_content_async(self, prompt, stream=False):
+        assert stream
+        async def chunks():
+            try:
+                for word in self._words(prompt):
+                    await asyncio.sleep(self.delay)
+                    self.sent += 1
+                    yield FakeChunk(word)
+            finally:
+                self.closed = True
+        return chunks()
+
+def test_text_stream_yields_chunks_and_times_them():
+    model = StreamingFakeModel()
+    stream = TextStream(model, "def factorial of n")
+    assert list(stream) == ["def ", "factorial ", "of ", "n "]
+    stats = stream.stats()
+    assert stats.completed and stats.chunks == 4 and stats.characters == 19
+    assert 0 < stats.first_chunk_seconds < stats.total_seconds
+    assert stream.text == "def factorial of n "
+
+def test_text_stream_stops_early():
+    model = StreamingFakeModel()
+    with TextStream(model, "one two three four five") as stream:
+        for text in stream:
+            if text == "two ":
+                break
+    assert model.sent == 2
+    assert model.closed
+    assert not stream.stats().completed
+    assert stream.stats().total_seconds is not None
+
+def test_text_stream_plain_break_closes_stream():
+    model = StreamingFakeModel()
+    stream = TextStream(model, "one two three four five")
+    for text in stream:
+        if text == "two ":
+            break
+    assert model.closed
+    assert model.sent == 2
+    assert stream.stats().total_seconds is not None
+    assert not stream.stats().completed
+    assert list(stream) == []
+
+def test_async_text_stream_plain_break_closes_stream():
+    model = StreamingFakeModel()
+
+    async def main():
+        stream = AsyncTextStream(model, "one two three four")
+        async for text in stream:
+            break
+        # The abandoned async generator is closed on the loop's next step.
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert model.closed
+        return stream
+
+    stream = asyncio.run(main())
+    assert model.sent == 1
+    assert stream.stats().total_seconds is not None
+
+def test_async_text_stream():
+    model = StreamingFakeModel()
+
+    async def main():
+        async with AsyncTextStream(model, "one two three four") as stream:
+            received = []
+            async for text in stream:
+                received.append(text)
+                if len(received) == 3:
+                    break
+        return stream, received
+
+    stream, received = asyncio.run(main())
+    assert received == ["one ", "two ", "three "]
+    assert model.sent == 3 and model.closed
+    assert stream.stats().first_chunk_seconds > 0
+
+class EchoChatModel:
+    """Replies "reply N"; remembers the contents of each request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def generate_content(self, contents, **kwargs):
+        self.requests.append(contents)
+        if isinstance(contents, str):
+            return FakeResponse("summary of earlier turns")
+        return FakeResponse(f"reply {len(self.requests)}")
+
+def one_token_per_word(text):
+    return len(text.split())
+
+def test_chat_session_keeps_history_within_budget():
+    model = EchoChatModel()
+    chat = ChatSession(model, max_tokens=8, count_tokens=one_token_per_word)
+    for i in range(10):
+        chat.send_message(f"question number {i}")
+        assert chat.tokens <= 8
+    last = model.requests[-1]
+    assert len(last) <= 5
+    assert last[-1] == {"role": "user", "parts": ["question number 9"]}
+    assert [role for role, _, _ in chat.history] == ["user", "model"] * (len(chat.history) // 2)
+
+def test_chat_session_summarises_dropped_turns():
+    model = EchoChatModel()
+    chat = ChatSession(model, max_tokens=12, policy=summarize_with(model), count_tokens=one_token_per_word)
+    for i in range(4):
+        chat.send_message(f"question number {i}")
+    assert chat.summary == "summary of earlier turns"
+    request = [contents for contents in model.requests if isinstance(contents, list)][-1]
+    assert "summary of earlier turns" in request[0]["parts"][0]
+
+def test_chat_session_keeps_turns_when_summary_fails():
+    model = EchoChatModel()
+
+    def failing_policy(summary, dropped):
+        raise ResourceExhausted("quota")
+
+    chat = ChatSession(model, max_tokens=12, policy=failing_policy, count_tokens=one_token_per_word)
+    for i in range(4):
+        response = chat.send_message(f"question number {i}")
+        assert response.text == f"reply {i + 1}"
+    assert chat.summary is None
+    assert len(chat.history) == 8
+    chat.policy = drop_oldest
+    chat.compact()
+    assert chat.tokens <= 12
+    assert chat.history[-2][1] == "question number 3"
+
+def test_chat_session_round_trip():
+    model = EchoChatModel()
+    chat = ChatSession(model, session_id="surya")
+    chat.send_message("What is a decorator?")
+    restored = ChatSession.from_dict(chat.to_dict(), model)
+    assert restored.contents() == chat.contents()
+    assert restored.tokens == chat.tokens
+
+def test_chat_manager_evicts_sessions_to_disk(tmp_path):
+    model = EchoChatModel()
+    manager = ChatManager(model, store_dir=str(tmp_path), max_sessions=2, policy=drop_oldest)
+    manager.send_message("surya", "Hi!")
+    manager.send_message("priya", "Hello!")
+    manager.send_message("arjun", "Hey!")
+    assert len(manager) == 2
+    assert (tmp_path / "surya.json").exists()
+    surya = manager.get("surya")
+    assert surya.history[0][1] == "Hi!"
+    with pytest.raises(ValueError):
+        manager.get("../escape")
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    sdk = types.ModuleType("google.generativeai")
+    sdk.configured = []
+    sdk.configure = lambda api_key: sdk.configured.append(api_key)
+    sdk.GenerativeModel = lambda name: types.SimpleNamespace(model_name=name)
+    google = types.ModuleType("google")
+    google.generativeai = sdk
+    monkeypatch.setitem(sys.modules, "google", google)
+    monkeypatch.setitem(sys.modules, "google.generativeai", sdk)
+    gemini_client.reset()
+    yield sdk
+    gemini_client.reset()
+
+def test_gemini_client_missing_key_raises(monkeypatch, fake_sdk):
+    # load_dotenv() never overrides a variable that is already set.
+    monkeypatch.setenv("GEMINI_API_KEY", "")
+    with pytest.raises(gemini_client.MissingAPIKeyError):
+        gemini_client.get_model()
+    assert fake_sdk.configured == []
+
+def test_gemini_client_configures_once(monkeypatch, fake_sdk):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    model = gemini_client.get_model()
+    assert model.model_name == gemini_client.DEFAULT_MODEL
+    assert gemini_client.get_model() is model
+    assert gemini_client.get_model("other").model_name == "other"
+    assert fake_sdk.configured == ["test-key"]
+
+def test_gemini_api_import_has_no_side_effects(monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    import gemini_api
+    assert callable(gemini_api.main)
+
+class SlowEchoModel(EchoChatModel):
+    def generate_content(self, contents, **kwargs):
+        time.sleep(0.005)
+        return super().generate_content(contents, **kwargs)
+
+def test_chat_manager_concurrent_sends_keep_every_turn(tmp_path):
+    model = SlowEchoModel()
+    manager = ChatManager(model, store_dir=str(tmp_path), max_sessions=1, max_tokens=10_000)
+    students = ["surya", "priya", "arjun"]
+
+    def chat(name):
+        for i in range(5):
+            manager.send_message(name, f"{name} question {i}")
+
+    threads = [threading.Thread(target=chat, args=(name,)) for name in students for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for name in students:
+        questions = [text for role, text, _ in manager.get(name).history if role == "user"]
+        assert len(questions) == 10
@@ -1,6 +1,18 @@
 import pytest
+import asyncio
+import logging
+import sys
+import os
+import threading
 import time
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'advanced_topics', 'decorators')))
+
+from auth import Permissions, UserRoles, require_auth, user_roles
+from caching import memoize
+from call_logging import log_calls
+import profiling
+
 def timer_decorator(func):
     def wrapper(*args, **kwargs):
         start_time = time.time()
@@ -71,3 +83,305 @@ def test_decorator_preserves_function():
     
     assert multiply(4, 5) == 20
     assert multiply(10, 2) == 20
+
+def test_memoize_caches_results():
+    calls = []
+
+    @memoize
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(4) == 16
+    assert square(4) == 16
+    assert calls == [4]
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+def test_memoize_handles_kwargs():
+    @memoize
+    def power(base, exp=2):
+        return base ** exp
+
+    assert power(3) == 9
+    assert power(3, exp=3) == 27
+    assert power(base=3, exp=3) == 27
+    assert power.cache_info().currsize == 3
+
+def test_memoize_lru_eviction():
+    @memoize(maxsize=2)
+    def identity(x):
+        return x
+
+    identity(1)
+    identity(2)
+    identity(1)
+    identity(3)
+    info = identity.cache_info()
+    assert info.evictions == 1
+    assert info.currsize == 2
+    identity(1)
+    assert identity.cache_info().hits == 2
+
+def test_memoize_ttl_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    @memoize(ttl=10)
+    def stamp(x):
+        return now[0]
+
+    assert stamp("a") == 100.0
+    now[0] = 105.0
+    assert stamp("a") == 100.0
+    now[0] = 111.0
+    assert stamp("a") == 111.0
+    assert stamp.cache_info().evictions == 1
+
+def test_memoize_cache_clear():
+    @memoize
+    def double(x):
+        return x * 2
+
+    double(1)
+    double.cache_clear()
+    assert double.cache_info() == (0, 0, 0, 128, 0)
+
+def test_memoize_recursive_and_threaded():
+    @memoize(maxsize=None)
+    def fibonacci(n):
+        if n < 2:
+            return n
+        return fibonacci(n - 1) + fibonacci(n - 2)
+
+    threads = [threading.Thread(target=fibonacci, args=(200,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert fibonacci(200) == 280571172992510140037611932413038677189525
+
+def test_timed_records_calls():
+    @profiling.timed(name="test_timed_records_calls")
+    def add(a, b):
+        return a + b
+
+    for i in range(100):
+        assert add(i, 1) == i + 1
+    summary = add.timing_stats.summary()
+    assert summary["calls"] == 100
+    assert summary["count"] == 100
+    assert summary["min_ns"] <= summary["p50_ns"] <= summary["p99_ns"] <= summary["max_ns"]
+    assert add.__name__ == "add"
+
+def test_timed_sampling():
+    @profiling.timed(sample_rate=0.25, name="test_timed_sampling")
+    def noop():
+        return None
+
+    for _ in range(100):
+        noop()
+    assert noop.timing_stats.calls == 100
+    assert noop.timing_stats.count == 25
+
+def test_timed_counts_every_call_across_threads():
+    @profiling.timed(sample_rate=0.5, name="test_timed_counts_every_call_across_threads")
+    def noop():
+        return None
+
+    def hammer():
+        for _ in range(5000):
+            noop()
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert noop.timing_stats.calls == 40000
+    assert noop.timing_stats.count == 20000
+
+def test_timed_keeps_stats_per_decorated_function():
+    def make_handler(delay):
+        @profiling.timed
+        def handler():
+            return delay
+        return handler
+
+    fast, slow = make_handler(0), make_handler(1)
+    for _ in range(3):
+        fast()
+    slow()
+    assert fast.timing_stats is not slow.timing_stats
+    assert fast.timing_stats.calls == 3
+    assert slow.timing_stats.calls == 1
+    names = [row["name"] for row in profiling.get_stats()]
+    assert names.count(fast.timing_stats.name) == 2
+
+def test_timed_histogram_percentiles():
+    stats = profiling.TimingStats("histogram")
+    for ns in range(1, 1001):
+        stats.record(ns * 1000)
+    assert stats.percentile(50) == pytest.approx(500_000, rel=0.04)
+    assert stats.percentile(99) == pytest.approx(990_000, rel=0.04)
+    assert stats.percentile(100) == 1_000_000
+
+def test_timed_report_lists_functions():
+    @profiling.timed(name="test_timed_report_lists_functions")
+    def work():
+        return sum(range(10))
+
+    work()
+    assert "test_timed_report_lists_functions" in profiling.report()
+    profiling.reset()
+    assert work.timing_stats.count == 0
+
+def test_async_memoize_single_flight():
+    calls = []
+
+    @memoize
+    async def load(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def main():
+        return await asyncio.gather(*(load("surya") for _ in range(10)))
+
+    assert asyncio.run(main()) == ["SURYA"] * 10
+    assert calls == ["surya"]
+    assert load.cache_info().misses == 1
+    assert asyncio.run(load("surya")) == "SURYA"
+    assert calls == ["surya"]
+
+def test_async_memoize_does_not_cache_errors():
+    attempts = []
+
+    @memoize
+    async def flaky(x):
+        attempts.append(x)
+        await asyncio.sleep(0)
+        if len(attempts) == 1:
+            raise ValueError("boom")
+        return x
+
+    async def main():
+        return await asyncio.gather(flaky(1), flaky(1), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert asyncio.run(flaky(1)) == 1
+    assert attempts == [1, 1]
+
+def test_async_timed_measures_awaited_work():
+    @profiling.timed(name="test_async_timed_measures_awaited_work")
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    assert asyncio.run(slow()) == "done"
+    assert slow.timing_stats.min_ns >= 15_000_000
+
+def test_async_require_auth(monkeypatch):
+    monkeypatch.setitem(user_roles, "Surya", "admin")
+
+    @require_auth("admin")
+    async def delete_user(username, target):
+        return f"{username} deleted {target}"
+
+    assert asyncio.run(delete_user("Surya", "old")) == "Surya deleted old"
+    assert asyncio.run(delete_user("Nobody", "old")) is None
+
+def test_async_log_calls(caplog):
+    @log_calls
+    async def add(a, b):
+        return a + b
+
+    with caplog.at_level(logging.DEBUG):
+        assert asyncio.run(add(2, 3)) == 5
+    assert "add returned 5" in caplog.text
+
+def test_require_auth_role_hierarchy():
+    roles = UserRoles({"Surya": "admin", "Priya": "user", "Arjun": "guest"})
+    perms = Permissions({"admin": ("user",), "user": ("guest",)}, roles)
+
+    @require_auth("user", perms)
+    def view_profile(username):
+        return True
+
+    assert view_profile("Surya") is True
+    assert view_profile("Priya") is True
+    assert view_profile("Arjun") is None
+    assert view_profile("Nobody") is None
+
+def test_require_auth_invalidates_on_role_change():
+    roles = UserRoles({"Priya": "user"})
+    perms = Permissions({"admin": ("user",)}, roles)
+
+    @require_auth("admin", perms)
+    def delete_user(username, target):
+        return target
+
+    assert delete_user("Priya", "old") is None
+    roles["Priya"] = "admin"
+    assert delete_user("Priya", "old") == "old"
+    del roles["Priya"]
+    assert delete_user("Priya", "old") is None
+
+def test_permissions_masks_and_cycles():
+    perms = Permissions({"admin": ("user",), "user": ()}, UserRoles({"Surya": "admin"}))
+    assert perms.mask_for("Surya") == perms.bit_for("admin") | perms.bit_for("user")
+    assert perms.mask_for("Unknown") == 0
+    with pytest.raises(ValueError):
+        perms.set_hierarchy({"a": ("b",), "b": ("a",)})
+
+def test_log_calls_uses_logging(caplog):
+    logger = logging.getLogger("test_log_calls_uses_logging")
+
+    @log_calls(logger=logger, level=logging.INFO)
+    def add_marks(subject, marks):
+        return f"{subject}: {marks}"
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        assert add_marks("Python", 95) == "Python: 95"
+    assert "Calling add_marks with args=('Python', 95), kwargs={}" in caplog.text
+    assert "add_marks returned Python: 95" in caplog.text
+
+def test_log_calls_skips_formatting_when_disabled():
+    logger = logging.getLogger("test_log_calls_skips_formatting")
+    logger.setLevel(logging.WARNING)
+    formatted = []
+
+    class Payload:
+        def __repr__(self):
+            formatted.append(True)
+            return "Payload()"
+
+    @log_calls(logger=logger)
+    def handle(payload):
+        return "ok"
+
+    assert handle(Payload()) == "ok"
+    assert formatted == []
+
+def test_log_calls_truncates_large_arguments(caplog):
+    logger = logging.getLogger("test_log_calls_truncates")
+
+    @log_calls(logger=logger, level=logging.INFO, max_arg_length=20)
+    def total(values):
+        return sum(values)
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        total(list(range(1000)))
+    assert "more chars>" in caplog.text
+    assert "999" not in caplog.text
+
+def test_log_calls_strip_if_disabled():
+    logger = logging.getLogger("test_log_calls_strip")
+    logger.setLevel(logging.ERROR)
+
+    def square(x):
+        return x * x
+
+    assert log_calls(square, logger=logger, strip_if_disabled=True) is square
+    assert log_calls(square, logger=logger) is not square
@@ -1,4 +1,17 @@
 import pytest
+import random
+import statistics
+import sys
+import os
+from fractions import Fraction
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'advanced_topics', 'generators')))
+
+from fibonacci import fib, fib_matrix, fib_range
+from file_reader import iter_line_batches, iter_line_views, read_lines
+from parallel_reader import byte_ranges, parallel_lines
+from pipeline import Pipeline
+from streaming_stats import StreamingStats, stats_generator
 
 def number_generator(n):
     for i in range(n):
@@ -66,3 +79,223 @@ def test_generator_with_filter():
     gen = all_numbers(10)
     result = [x for x in gen if x % 2 == 0]
     assert result == [0, 2, 4, 6, 8]
+
+@pytest.fixture
+def students_file(tmp_path):
+    path = tmp_path / "students.txt"
+    path.write_bytes(b"Surya\n  Priya \nArjun\r\nRavi\nMeera")
+    return str(path)
+
+def test_read_lines_matches_text_iteration(students_file):
+    with open(students_file) as file:
+        expected = [line.strip() for line in file]
+    assert list(read_lines(students_file)) == expected
+    assert list(read_lines(students_file, window_size=4)) == expected
+
+def test_read_lines_without_strip(students_file):
+    assert list(read_lines(students_file, strip=False)) == ["Surya", "  Priya ", "Arjun\r", "Ravi", "Meera"]
+
+def test_read_lines_empty_and_missing_file(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    assert list(read_lines(str(empty))) == []
+    with pytest.raises(FileNotFoundError):
+        list(read_lines(str(tmp_path / "missing.txt")))
+
+def test_line_batches_resume_from_offset(students_file):
+    batches = list(iter_line_batches(students_file, window_size=8))
+    lines = [line for _, batch in batches for line in batch]
+    assert lines == [b"Surya", b"  Priya ", b"Arjun\r", b"Ravi", b"Meera"]
+
+    resume_at, first = batches[0]
+    rest = [line for _, batch in iter_line_batches(students_file, start=resume_at) for line in batch]
+    assert first + rest == lines
+
+def test_byte_ranges_split_on_line_boundaries(students_file):
+    size = os.path.getsize(students_file)
+    for cut in range(size + 1):
+        head = list(read_lines(students_file, end=cut, strip=False))
+        tail = list(read_lines(students_file, start=cut, strip=False))
+        assert head + tail == list(read_lines(students_file, strip=False))
+
+def test_iter_line_views(students_file):
+    lines = [bytes(view) for view in iter_line_views(students_file)]
+    assert lines == [b"Surya", b"  Priya ", b"Arjun\r", b"Ravi", b"Meera"]
+
+def test_unmappable_files_fall_back_to_buffered_reads(students_file, monkeypatch):
+    import file_reader
+    expected = list(read_lines(students_file, strip=False))
+    mapped_batches = [
+        [line for _, batch in iter_line_batches(students_file, start=cut) for line in batch]
+        for cut in range(os.path.getsize(students_file) + 1)
+    ]
+    monkeypatch.setattr(file_reader, "_open_map", lambda filename: None)
+    assert list(read_lines(students_file, strip=False)) == expected
+    for cut, mapped in enumerate(mapped_batches):
+        assert [line for _, batch in iter_line_batches(students_file, start=cut) for line in batch] == mapped
+    assert [bytes(view) for view in iter_line_views(students_file)] == [line.encode() for line in expected]
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_read_lines_from_pipe(tmp_path):
+    import threading
+    fifo = str(tmp_path / "pipe")
+    os.mkfifo(fifo)
+
+    def write():
+        with open(fifo, "w") as pipe:
+            pipe.write("Surya\nPriya\n")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    assert list(read_lines(fifo)) == ["Surya", "Priya"]
+    writer.join()
+
+def test_byte_ranges():
+    assert byte_ranges(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert byte_ranges(0, 4) == []
+
+def test_parallel_lines_ordered(tmp_path):
+    path = tmp_path / "numbers.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(500)))
+    result = list(parallel_lines(str(path), str.upper, workers=2, chunk_size=97))
+    assert result == [f"LINE {i}" for i in range(500)]
+
+def test_parallel_lines_as_completed(tmp_path):
+    path = tmp_path / "numbers.txt"
+    path.write_text("".join(f"{i}\n" for i in range(500)))
+    result = list(parallel_lines(str(path), int, workers=2, ordered=False, chunk_size=64))
+    assert sorted(result) == list(range(500))
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_parallel_lines_from_pipe(tmp_path):
+    import threading
+    fifo = str(tmp_path / "pipe")
+    os.mkfifo(fifo)
+
+    def write():
+        with open(fifo, "w") as pipe:
+            pipe.write("Surya\nPriya\n")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    assert list(parallel_lines(fifo, len, workers=2)) == [5, 5]
+    writer.join()
+
+def test_parallel_lines_single_worker(tmp_path):
+    path = tmp_path / "names.txt"
+    path.write_text("Surya\nPriya\n")
+    assert list(parallel_lines(str(path), len, workers=1)) == [5, 5]
+
+def counter_generator(start=0):
+    count = start
+    while True:
+        yield count
+        count += 1
+
+def test_pipeline_fused_map_filter():
+    pipeline = Pipeline(range(10)).map(lambda x: x * 3).filter(lambda x: x % 2 == 0).map(lambda x: x + 1)
+    assert pipeline.collect() == [1, 7, 13, 19, 25]
+    assert list(Pipeline(range(5)).map(str)) == ["0", "1", "2", "3", "4"]
+
+def test_pipeline_unbounded_source():
+    pipeline = Pipeline(counter_generator(1)).filter(lambda n: n % 2 == 0).batch(3).take(2)
+    assert list(pipeline) == [[2, 4, 6], [8, 10, 12]]
+
+def test_pipeline_window_and_dedupe():
+    assert list(Pipeline([1, 2, 3, 4, 5]).window(3)) == [(1, 2, 3), (2, 3, 4), (3, 4, 5)]
+    assert list(Pipeline(range(7)).window(2, step=3)) == [(0, 1), (3, 4)]
+    assert list(Pipeline([3, 1, 3, 2, 1]).dedupe()) == [3, 1, 2]
+    assert list(Pipeline([1, 1, 2, 2, 1]).dedupe(consecutive=True)) == [1, 2, 1]
+    words = ["Surya", "surya", "Priya"]
+    assert list(Pipeline(words).dedupe(key=str.lower)) == ["Surya", "Priya"]
+
+def test_pipeline_is_immutable_and_lazy():
+    pulled = []
+
+    def source():
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    base = Pipeline(source())
+    first_three = base.map(lambda x: x * 2).take(3)
+    assert first_three is not base
+    assert list(first_three) == [0, 2, 4]
+    assert pulled == [0, 1, 2]
+
+def test_pipeline_profile_stats():
+    pipeline = Pipeline(range(10), profile=True).filter(lambda x: x % 2 == 0).map(lambda x: x * x).take(3)
+    assert list(pipeline) == [0, 4, 16]
+    stats = pipeline.stats()
+    assert [stage["stage"] for stage in stats] == ["source", "filter", "map", "take"]
+    assert [stage["items"] for stage in stats] == [5, 3, 3, 3]
+    assert all(stage["seconds"] >= 0 for stage in stats)
+
+def test_streaming_stats_matches_statistics():
+    marks = [85, 92, 78, 95, 88]
+    stats = StreamingStats()
+    for mark in marks:
+        stats.update(mark)
+    assert stats.count == 5
+    assert stats.mean == pytest.approx(statistics.mean(marks))
+    assert stats.variance == pytest.approx(statistics.variance(marks))
+    assert (stats.min, stats.max) == (78, 95)
+    assert stats.quantile(0.5) == pytest.approx(88)
+
+def test_streaming_stats_precision_with_large_offset():
+    stats = StreamingStats()
+    stats.update_many([1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16])
+    assert stats.variance == pytest.approx(30.0)
+
+def test_streaming_stats_merge_equals_single_stream():
+    rng = random.Random(7)
+    values = [rng.gauss(50, 10) for _ in range(20000)]
+    left, right = StreamingStats(), StreamingStats()
+    for value in values[:5000]:
+        left.update(value)
+    right.update_many(values[5000:])
+    left.merge(right)
+    ordered = sorted(values)
+    assert left.count == len(values)
+    assert left.mean == pytest.approx(statistics.fmean(values))
+    assert left.variance == pytest.approx(statistics.variance(values))
+    for q in (0.05, 0.5, 0.95, 0.99):
+        assert left.quantile(q) == pytest.approx(ordered[int(q * len(ordered))], abs=0.5)
+
+def test_stats_generator_accepts_values_and_batches():
+    gen = stats_generator()
+    next(gen)
+    gen.send(85)
+    stats = gen.send([92, 78])
+    assert stats.count == 3
+    assert stats.mean == pytest.approx(85)
+    with pytest.raises(StopIteration):
+        gen.send(None)
+
+def test_stats_generator_treats_any_real_number_as_one_value():
+    gen = stats_generator()
+    next(gen)
+    gen.send(Fraction(1, 2))
+    stats = gen.send(Fraction(3, 2))
+    assert stats.count == 2
+    assert stats.mean == pytest.approx(1)
+
+def test_fast_doubling_fib():
+    expected = list(fibonacci_generator(200))
+    assert [fib(n) for n in range(200)] == expected
+    assert [fib_matrix(n) for n in range(200)] == expected
+    assert fib(1000) % 10 ** 9 == 849228875
+    with pytest.raises(ValueError):
+        fib(-1)
+
+def test_fib_range_seeks_and_iterates():
+    expected = list(fibonacci_generator(120))
+    assert list(fib_range(100, 120)) == expected[100:120]
+    assert list(fib_range(5, 5)) == []
+
+def test_fib_modular():
+    mod = 1_000_000_007
+    expected = list(fibonacci_generator(300))
+    assert [fib(n, mod) for n in range(300)] == [value % mod for value in expected]
+    assert list(fib_range(250, 300, mod)) == [value % mod for value in expected[250:300]]
+    assert fib(10 ** 18, mod) == fib_matrix(10 ** 18, mod)
@@ -1,6 +1,15 @@
 import pytest
+import operator
+import sys
+import os
 from functools import reduce
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'advanced_topics', 'higher_order_functions')))
+
+import parallel_reduce as parallel_reduce_module
+from parallel_reduce import kahan_sum, parallel_reduce
+from vectorized import Chain
+
 def test_map_basic():
     numbers = [1, 2, 3, 4, 5]
     squared = list(map(lambda x: x ** 2, numbers))
@@ -77,3 +86,109 @@ def test_map_with_function_reference():
     
     result = list(map(square_root, numbers))
     assert result == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+SALES = [1200, 3500, 800, 4500, 2000, 5500]
+
+def test_chain_python_backend():
+    chain = Chain(SALES, use_numpy=False).filter(lambda x: x > 2000).map(lambda x: x * 0.9)
+    assert chain.backend == "python"
+    assert chain.reduce("sum") == pytest.approx(12150.0)
+    assert Chain([2, 3, 4], use_numpy=False).reduce(operator.mul) == 24
+    assert Chain([45, 23, 78], use_numpy=False).reduce("max") == 78
+    assert Chain([], use_numpy=False).reduce("sum", 0) == 0
+
+def test_chain_non_numeric_falls_back():
+    names = Chain(["surya", "priya"]).map(str.capitalize)
+    assert names.backend == "python"
+    assert names.to_list() == ["Surya", "Priya"]
+
+def test_chain_defaults_to_python():
+    assert Chain(SALES).backend == "python"
+    assert Chain(SALES).map(lambda x: x * 2).reduce("sum") == 2 * sum(SALES)
+
+def test_chain_numpy_backend():
+    pytest.importorskip("numpy")
+    chain = Chain(SALES, use_numpy=True).filter(lambda x: x > 2000).map(lambda x: x * 0.9)
+    assert chain.backend == "numpy"
+    assert chain.reduce("sum") == pytest.approx(12150.0)
+    assert Chain([2, 3, 4], use_numpy=True).reduce(operator.mul) == 24
+    assert Chain([45, 23, 78], use_numpy=True).reduce(max) == 78
+    assert Chain([1, 2, 3], use_numpy=True).reduce(operator.add, 10) == 16
+
+def test_chain_numpy_falls_back_for_scalar_only_functions():
+    pytest.importorskip("numpy")
+    grades = Chain([85, 92, 78], use_numpy=True).map(lambda m: "A" if m >= 90 else "B")
+    assert grades.backend == "python"
+    assert grades.to_list() == ["B", "A", "B"]
+    assert Chain([1, 2, 3], use_numpy=True).reduce(lambda x, y: x + y) == 6
+
+def test_chain_numpy_map_does_not_overflow_int64():
+    pytest.importorskip("numpy")
+    squares = Chain([3_000_000_000, 2], use_numpy=True).map(lambda x: x * x)
+    assert squares.backend == "python"
+    assert squares.to_list() == [9_000_000_000_000_000_000, 4]
+    doubled = Chain([3_000_000_000, 2], use_numpy=True).map(lambda x: x * 2)
+    assert doubled.backend == "numpy"
+    assert doubled.to_list() == [6_000_000_000, 4]
+
+def test_chain_numpy_map_raises_like_python_on_division_by_zero():
+    pytest.importorskip("numpy")
+    for use_numpy in (False, True):
+        with pytest.raises(ZeroDivisionError):
+            Chain([1, 2, 3, 4, 5, 0], use_numpy=use_numpy).map(lambda x: 10 / x).to_list()
+    with pytest.raises(OverflowError):
+        Chain([10.0, 2.0], use_numpy=True).map(lambda x: x ** 1000).to_list()
+
+def concat(a, b):
+    return a + b
+
+def test_kahan_sum():
+    assert kahan_sum([0.1] * 10) == 1.0
+    assert kahan_sum([1e16, 1.0, -1e16]) == 1.0
+    assert kahan_sum([]) == 0.0
+
+def test_parallel_reduce_serial_path():
+    numbers = [45, 23, 78, 12, 56]
+    assert parallel_reduce("max", numbers) == 78
+    assert parallel_reduce(operator.mul, [2, 3, 4]) == 24
+    assert parallel_reduce(lambda x, y: x + y, numbers, initial=100) == 314
+    assert parallel_reduce("sum", [], initial=0) == 0
+    with pytest.raises(TypeError):
+        parallel_reduce("sum", [])
+    with pytest.raises(ValueError):
+        parallel_reduce("median", numbers)
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_parallel_reduce_chunks(monkeypatch, executor):
+    monkeypatch.setattr(parallel_reduce_module, "SERIAL_THRESHOLD", 10)
+    numbers = list(range(1000))
+    assert parallel_reduce("sum", numbers, workers=2, chunk_size=64, executor=executor) == sum(numbers)
+    assert parallel_reduce("min", iter(numbers), workers=2, chunk_size=64, executor=executor) == 0
+    # Not commutative: chunk order must be kept when combining.
+    letters = [chr(97 + i % 26) for i in range(500)]
+    assert parallel_reduce(concat, letters, workers=2, chunk_size=37, executor=executor) == "".join(letters)
+
+def test_parallel_reduce_kahan_revenue(monkeypatch):
+    monkeypatch.setattr(parallel_reduce_module, "SERIAL_THRESHOLD", 10)
+    values = [0.1] * 1000
+    assert parallel_reduce("kahan", values, workers=2, chunk_size=100, executor="thread") == 100.0
+    assert reduce(lambda x, y: x + y, values) != 100.0
+
+def add_marks(total, student):
+    return total + student["marks"]
+
+def test_parallel_reduce_with_accumulator_and_combiner(monkeypatch):
+    students = [{"name": "Surya", "marks": 1}, {"name": "Priya", "marks": 2}]
+    assert parallel_reduce(lambda acc, s: acc + s["marks"], students, combiner=operator.add, initial=0) == 3
+    assert parallel_reduce(add_marks, [], combiner=operator.add, initial=0) == 0
+    with pytest.raises(TypeError):
+        parallel_reduce(add_marks, students, combiner=operator.add)
+    with pytest.raises(ValueError, match="own combiner"):
+        parallel_reduce("sum", [1, 2], combiner=operator.add)
+
+    monkeypatch.setattr(parallel_reduce_module, "SERIAL_THRESHOLD", 10)
+    many = [{"marks": i} for i in range(500)]
+    for executor in ("process", "thread"):
+        result = parallel_reduce(add_marks, many, combiner=operator.add, initial=0,
+                                 workers=2, chunk_size=37, executor=executor)
+        assert result == sum(range(500))
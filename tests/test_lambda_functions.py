@@ -1,4 +1,11 @@
 import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'advanced_topics', 'lambda_functions')))
+
+from ranking import RunningTopK, rank, running_top_k, top_k
 
 def test_basic_lambda():
     add = lambda x, y: x + y
@@ -63,3 +70,49 @@ def test_lambda_with_filter():
     numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     evens = list(filter(lambda x: x % 2 == 0, numbers))
     assert evens == [2, 4, 6, 8, 10]
+
+@pytest.fixture
+def students():
+    return [
+        {"name": "Surya", "marks": 95},
+        {"name": "Priya", "marks": 88},
+        {"name": "Arjun", "marks": 92},
+        {"name": "Meera", "marks": 92},
+        {"name": "Ravi", "marks": 85}
+    ]
+
+def test_top_k_matches_sorted(students):
+    expected = sorted(students, key=lambda s: s["marks"], reverse=True)
+    assert top_k(students, 3, key="marks") == expected[:3]
+    assert top_k(students, 3, key=lambda s: s["marks"]) == expected[:3]
+    assert [s["name"] for s in top_k(students, 2, key="marks", largest=False)] == ["Ravi", "Priya"]
+    assert top_k(students, 0, key="marks") == []
+    assert top_k([3, 1, 2], 10) == [3, 2, 1]
+
+def test_running_top_k_matches_top_k():
+    rng = random.Random(7)
+    data = [rng.randint(0, 50) for _ in range(2000)]
+    batches = [data[i:i + 100] for i in range(0, len(data), 100)]
+    for largest in (True, False):
+        results = list(running_top_k(batches, 10, largest=largest))
+        assert len(results) == len(batches)
+        assert results[-1] == top_k(data, 10, largest=largest)
+
+def test_running_top_k_keeps_earliest_ties(students):
+    tracker = RunningTopK(2, key="marks")
+    tracker.update(students[:2]).update(students[2:])
+    assert [s["name"] for s in tracker.items()] == ["Surya", "Arjun"]
+    assert tracker.seen == 5
+    with pytest.raises(ValueError):
+        RunningTopK(0)
+
+def test_rank_with_ties(students):
+    ranked = rank(students, key="marks")
+    assert [(position, s["name"]) for position, s in ranked] == [
+        (1, "Surya"), (2, "Arjun"), (2, "Meera"), (4, "Priya"), (5, "Ravi")
+    ]
+    assert [position for position, _ in rank(students, key="marks", method="dense")] == [1, 2, 2, 3, 4]
+    assert [position for position, _ in rank(students, key="marks", method="ordinal")] == [1, 2, 3, 4, 5]
+    assert rank(students, key="marks", k=3) == ranked[:3]
+    with pytest.raises(ValueError):
+        rank(students, method="average")
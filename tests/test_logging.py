@@ -2,6 +2,15 @@ import pytest
 import logging
 import os
 import tempfile
+import gzip
+import time
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'advanced_topics', 'logging')))
+
+from async_logging import AsyncLogging, BatchFileHandler, BatchStreamHandler, BoundedQueueHandler
+from rotating_logs import CompressingRotatingFileHandler
 
 def test_logging_basic_levels():
     logger = logging.getLogger("test_basic")
@@ -94,3 +103,165 @@ def test_multiple_handlers(tmp_path):
     logger.addHandler(stream_handler)
     
     assert len(logger.handlers) == 2
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def test_async_logging_writes_everything_on_stop(tmp_path):
+    log_file = tmp_path / "async.log"
+    logger = logging.getLogger("test_async_file")
+    logger.propagate = False
+    handler = BatchFileHandler(log_file)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    with AsyncLogging([handler], logger=logger, level=logging.INFO, batch_size=16):
+        for i in range(100):
+            logger.info("student %d added", i)
+        logger.debug("not written")
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 100
+    assert lines[0] == "INFO student 0 added"
+    assert lines[-1] == "INFO student 99 added"
+    assert logger.handlers == []
+
+def test_async_logging_respects_handler_levels():
+    logger = logging.getLogger("test_async_levels")
+    logger.propagate = False
+    recording = RecordingHandler()
+    recording.setLevel(logging.WARNING)
+    with AsyncLogging([recording], logger=logger, level=logging.DEBUG):
+        logger.info("info")
+        logger.warning("warning %s", "here")
+    assert recording.messages == ["warning here"]
+
+def fill_queue(handler, count):
+    logger = logging.getLogger(f"test_overflow_{handler.overflow}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    for i in range(count):
+        logger.info("message %d", i)
+    logger.removeHandler(handler)
+    return [handler.queue.get_nowait().getMessage() for _ in range(handler.queue.qsize())]
+
+def test_overflow_drop_new():
+    handler = BoundedQueueHandler(maxsize=3, overflow="drop_new")
+    assert fill_queue(handler, 5) == ["message 0", "message 1", "message 2"]
+    assert handler.dropped == 2
+
+def test_overflow_drop_oldest():
+    handler = BoundedQueueHandler(maxsize=3, overflow="drop_oldest")
+    assert fill_queue(handler, 5) == ["message 2", "message 3", "message 4"]
+    assert handler.dropped == 2
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(overflow="ignore")
+
+def test_overflow_block_loses_nothing(tmp_path):
+    logger = logging.getLogger("test_async_block")
+    logger.propagate = False
+    recording = RecordingHandler()
+    with AsyncLogging([recording], logger=logger, level=logging.INFO, maxsize=4, overflow="block") as async_logging:
+        threads = [
+            threading.Thread(target=lambda n=n: [logger.info("%d-%d", n, i) for i in range(50)])
+            for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(recording.messages) == 200
+    assert async_logging.dropped == 0
+
+def test_dropped_records_are_reported(capsys):
+    logger = logging.getLogger("test_async_report")
+    logger.propagate = False
+    stream = BatchStreamHandler()
+    async_logging = AsyncLogging([stream], logger=logger, level=logging.INFO, maxsize=1, overflow="drop_new")
+    async_logging.queue_handler.dropped = 3
+    async_logging.start()
+    async_logging.stop()
+    assert "3 log records were dropped" in capsys.readouterr().err
+
+def rotating_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger
+
+def test_rotating_handler_rotates_and_compresses(tmp_path):
+    handler = CompressingRotatingFileHandler(tmp_path / "students.log", max_bytes=500, backup_bytes=None)
+    logger = rotating_logger("test_rotate_size", handler)
+    for i in range(100):
+        logger.info("Student %03d registered", i)
+    logger.removeHandler(handler)
+    handler.close()
+    segments = handler.segments()
+    assert len(segments) > 1
+    assert all(path.endswith(".gz") for path in segments)
+    lines = []
+    for path in segments:
+        lines.extend(gzip.open(path, "rt").read().splitlines())
+    lines.extend((tmp_path / "students.log").read_text().splitlines())
+    assert lines == [f"Student {i:03d} registered" for i in range(100)]
+
+def test_rotating_handler_retention(tmp_path):
+    handler = CompressingRotatingFileHandler(tmp_path / "app.log", max_bytes=200, backup_bytes=300, compression=None)
+    logger = rotating_logger("test_rotate_retention", handler)
+    for i in range(200):
+        logger.info("message %d", i)
+    logger.removeHandler(handler)
+    handler.close()
+    sizes = [os.path.getsize(path) for path in handler.segments()]
+    assert sizes and sum(sizes) <= 300
+
+def test_rotating_handler_interval(tmp_path):
+    handler = CompressingRotatingFileHandler(tmp_path / "timed.log", max_bytes=0, interval=0.05)
+    logger = rotating_logger("test_rotate_interval", handler)
+    logger.info("first")
+    time.sleep(0.06)
+    logger.info("second")
+    logger.removeHandler(handler)
+    handler.close()
+    assert len(handler.segments()) == 1
+    assert (tmp_path / "timed.log").read_text() == "second\n"
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+def test_rotating_handler_segments_stay_ordered_across_dst(tmp_path, monkeypatch):
+    # 01:30 BST, then 01:15 GMT 45 minutes later, when UK clocks go back.
+    moments = iter([1729989000 * 10 ** 9, (1729989000 + 45 * 60) * 10 ** 9])
+    monkeypatch.setattr(time, "time_ns", lambda: next(moments))
+    monkeypatch.setenv("TZ", "Europe/London")
+    time.tzset()
+    try:
+        handler = CompressingRotatingFileHandler(tmp_path / "dst.log", max_bytes=0, compression=None)
+        logger = rotating_logger("test_rotate_dst", handler)
+        for message in ("before", "after"):
+            logger.info(message)
+            handler.doRollover()
+        logger.removeHandler(handler)
+        handler.close()
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+    assert [open(path).read() for path in handler.segments()] == ["before\n", "after\n"]
+
+def test_rotating_handler_in_multi_handler_setup(tmp_path):
+    student_logger = logging.getLogger("test_rotate_multi")
+    student_logger.propagate = False
+    student_logger.setLevel(logging.DEBUG)
+    file_handler = CompressingRotatingFileHandler(tmp_path / "students.log")
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(logging.Formatter('[%(levelname)s] - %(message)s'))
+    student_logger.addHandler(file_handler)
+    student_logger.debug("Debug: Student data loaded")
+    student_logger.info("Info: Student Arjun registered")
+    student_logger.removeHandler(file_handler)
+    file_handler.close()
+    assert (tmp_path / "students.log").read_text() == "[INFO] - Info: Student Arjun registered\n"
+    with pytest.raises(ValueError):
+        CompressingRotatingFileHandler(tmp_path / "x.log", compression="lzma")
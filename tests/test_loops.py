@@ -1,4 +1,14 @@
 import pytest
+import sys
+import io
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'for loop')))
+
+from primes import iter_classified, iter_primes, is_prime, is_prime_many, primes_up_to
+from parallel_primes import pack_flags, parallel_sieve
+from prime_report import PrimeReportWriter
+from primes import iter_segments
 
 def test_basic_for_loop():
     result = []
@@ -58,3 +68,98 @@ def test_while_with_continue():
             continue
         result.append(count)
     assert result == [1, 3, 5, 7, 9]
+
+def trial_division(num):
+    if num < 2:
+        return False
+    for i in range(2, int(num ** 0.5) + 1):
+        if num % i == 0:
+            return False
+    return True
+
+def test_primes_up_to():
+    assert primes_up_to(30) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert primes_up_to(1) == []
+    assert primes_up_to(2) == [2]
+
+def test_sieve_matches_trial_division():
+    expected = [num for num in range(2000) if trial_division(num)]
+    assert list(iter_primes(0, 2000, segment_size=64)) == expected
+
+def test_iter_primes_offset_range():
+    result = list(iter_primes(100, 150, segment_size=7))
+    assert result == [num for num in range(100, 150) if trial_division(num)]
+
+def test_iter_classified():
+    result = list(iter_classified(2, 8))
+    assert result == [(2, True), (3, True), (4, False), (5, True), (6, False), (7, True)]
+
+def test_is_prime():
+    assert is_prime(97)
+    assert not is_prime(1)
+    assert not is_prime(91)
+    assert is_prime(7919)
+
+def test_pack_flags():
+    assert pack_flags(bytearray([1, 0, 1, 1, 0, 0, 0, 0, 1])) == bytes([0b1101, 0b1])
+
+def test_parallel_sieve_matches_serial():
+    with parallel_sieve(1000, workers=2, segment_size=60) as bitmap:
+        assert list(bitmap) == primes_up_to(1000)
+        assert bitmap.prime_count == 168
+        assert bitmap.is_prime(997)
+        assert 1000 not in bitmap
+
+def test_is_prime_large_inputs():
+    assert is_prime(1000000000000000003)
+    assert is_prime(2 ** 61 - 1)
+    assert not is_prime(3215031751)
+    assert not is_prime(2 ** 64 - 1)
+
+def test_is_prime_many():
+    numbers = list(range(-3, 500))
+    assert is_prime_many(numbers) == [trial_division(num) for num in numbers]
+    assert is_prime_many([2 ** 61 - 1, 25326001, 7]) == [True, False, True]
+    assert is_prime_many([]) == []
+    assert is_prime_many([-5] * 65) == [False] * 65
+    assert is_prime_many([0, 1] * 40) == [False] * 80
+
+def test_is_prime_many_skips_sieve_for_sparse_batches(monkeypatch):
+    import primes
+    sieved = []
+    real_sieve = primes._sieve_segment
+    monkeypatch.setattr(primes, "_sieve_segment", lambda *args: sieved.append(args) or real_sieve(*args))
+    assert is_prime_many([3] * 64 + [(1 << 24) - 3]) == [True] * 64 + [is_prime((1 << 24) - 3)]
+    assert not sieved
+    assert is_prime_many(range(1000)) == [is_prime(n) for n in range(1000)]
+    assert sieved
+
+def expected_report(n):
+    lines = []
+    for num in range(2, n + 1):
+        if trial_division(num):
+            lines.append(f"{num} is a Prime Number\n")
+        else:
+            lines.append(f"{num} is Not a Prime Number\n")
+    return "".join(lines)
+
+def test_report_writer_segments_match_print_format():
+    out = io.StringIO()
+    with PrimeReportWriter(out, buffer_size=64) as report:
+        for start, flags in iter_segments(2, 200, segment_size=16):
+            report.add_segment(start, flags)
+    assert out.getvalue() == expected_report(199)
+
+def test_report_writer_single_numbers():
+    out = io.StringIO()
+    with PrimeReportWriter(out) as report:
+        for num in range(2, 50):
+            report.add(num, trial_division(num))
+    assert out.getvalue() == expected_report(49)
+
+def test_report_writer_summary():
+    out = io.StringIO()
+    with PrimeReportWriter(out, summary=True) as report:
+        for start, flags in iter_segments(2, 101):
+            report.add_segment(start, flags)
+    assert out.getvalue() == "Checked 99 numbers\nPrime Numbers found: 25\nLast Prime Number: 97\n"
@@ -0,0 +1,81 @@
+import pytest
+import math
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'data_structures')))
+
+from student_table import StudentTable
+
+@pytest.fixture
+def students():
+    return [
+        {"name": "Surya", "marks": 95, "section": "A"},
+        {"name": "Priya", "marks": 88, "section": "B"},
+        {"name": "Arjun", "marks": 92, "section": "A"},
+        {"name": "Ravi", "marks": 75, "section": "B"},
+        {"name": "Meera", "marks": 98, "section": "A"}
+    ]
+
+@pytest.fixture
+def ragged_students():
+    return [
+        {"name": "Surya", "marks": [85, 90, 88]},
+        {"name": "Priya", "marks": [92, 88, 95]},
+        {"name": "Arjun", "marks": [78, 82, 80]},
+        {"name": "Meera", "marks": [95, 98, 93]}
+    ]
+
+def names(table):
+    return [record["name"] for record in table.to_records()]
+
+def test_round_trip(students):
+    table = StudentTable.from_records(students)
+    assert len(table) == 5
+    assert table.to_records() == students
+    assert table[0] == {"name": "Surya", "marks": 95.0, "section": "A"}
+
+def test_ragged_round_trip(ragged_students):
+    table = StudentTable.from_records(ragged_students)
+    assert table.is_ragged
+    assert table.to_records() == ragged_students
+    assert list(table.scores()) == pytest.approx([87.666666, 91.666666, 80.0, 95.333333])
+
+def test_filter(students):
+    table = StudentTable.from_records(students)
+    assert names(table.filter(lambda marks: marks >= 90)) == ["Surya", "Arjun", "Meera"]
+
+def test_sort_by(students):
+    table = StudentTable.from_records(students)
+    expected = sorted(students, key=lambda s: s["marks"], reverse=True)
+    assert table.sort_by(reverse=True).to_records() == expected
+    assert names(table.sort_by("name")) == ["Arjun", "Meera", "Priya", "Ravi", "Surya"]
+
+def test_top_k(students):
+    table = StudentTable.from_records(students)
+    assert names(table.top_k(2)) == ["Meera", "Surya"]
+    assert names(table.top_k(2, largest=False)) == ["Ravi", "Priya"]
+    assert names(table.top_k(10)) == ["Meera", "Surya", "Arjun", "Priya", "Ravi"]
+    assert len(table.top_k(0)) == 0
+
+def test_group_by_mean(students):
+    table = StudentTable.from_records(students)
+    assert table.group_by_mean("section") == {"A": 95.0, "B": 81.5}
+
+def test_ragged_filter_and_top_k(ragged_students):
+    table = StudentTable.from_records(ragged_students)
+    assert names(table.filter(lambda average: average >= 90)) == ["Priya", "Meera"]
+    assert table.top_k(1).to_records() == [{"name": "Meera", "marks": [95, 98, 93]}]
+
+def test_empty_marks_and_table():
+    table = StudentTable(["Nobody"], [], offsets=[0, 0])
+    assert math.isnan(table.scores()[0])
+    empty = StudentTable.from_records([])
+    assert len(empty) == 0
+    assert empty.top_k(3).to_records() == []
+
+def test_invalid_lengths():
+    with pytest.raises(ValueError):
+        StudentTable(["Surya", "Priya"], [95])
+    with pytest.raises(ValueError):
+        StudentTable(["Surya"], [95, 90], offsets=[0])